@@ -2,20 +2,45 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 
-from eldom.client import InvalidCredentialsError as EldomInvalidCredentialsError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import aiohttp_client
-from ioteldom.client import InvalidCredentialsError as IoTEldomInvalidCredentialsError
-
-from .const import CONF_API, DOMAIN
-from .coordinator import EldomCoordinator
-from .eldom_client import EldomClientWrapper
+from homeassistant.helpers import aiohttp_client, config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_API,
+    CONF_BULK_STATUS,
+    CONF_DEVICE_CACHE_TTL,
+    CONF_HEDGED_REQUESTS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_STALENESS,
+    CONF_RATE_LIMIT,
+    CONF_STAGGERED_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BULK_STATUS,
+    DEFAULT_DEVICE_CACHE_TTL,
+    DEFAULT_HEDGED_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_STAGGERED_POLLING,
+    DOMAIN,
+)
+from .auth import SESSION_SAVE_DELAY, session_store
+from .coordinator import EldomCoordinator, snapshot_store
+from .eldom_client import (
+    EldomClientWrapper,
+    InvalidCredentialsError,
+    async_import_api_client,
+)
 from .models import EldomData
+from .services import async_setup_services
 
 PLATFORMS: list[Platform] = [
     Platform.BUTTON,
@@ -25,9 +50,18 @@ PLATFORMS: list[Platform] = [
     Platform.WATER_HEATER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Eldom integration."""
+    async_setup_services(hass)
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Eldom from a config entry."""
     session = aiohttp_client.async_create_clientsession(hass)
@@ -36,13 +70,94 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     password = entry.data[CONF_PASSWORD]
     api = entry.data[CONF_API]
 
-    client = EldomClientWrapper(session, username, password, api)
+    await async_import_api_client(hass, api)
+    client = EldomClientWrapper(
+        session,
+        username,
+        password,
+        api,
+        max_concurrent_requests=entry.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        ),
+        device_cache_ttl=timedelta(
+            minutes=entry.options.get(CONF_DEVICE_CACHE_TTL, DEFAULT_DEVICE_CACHE_TTL)
+        ),
+        bulk_status=entry.options.get(CONF_BULK_STATUS, DEFAULT_BULK_STATUS),
+        hedged_requests=entry.options.get(
+            CONF_HEDGED_REQUESTS, DEFAULT_HEDGED_REQUESTS
+        ),
+        rate_limit=entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+    )
+
+    # A stored session is reused as is, and only replaced by a fresh login once
+    # the API rejects it.
+    store = session_store(hass, entry.entry_id)
+    client.session_listener = lambda: store.async_delay_save(
+        client.export_session, SESSION_SAVE_DELAY
+    )
+
+    stored_session = await store.async_load()
+    session_restored = stored_session is not None and client.restore_session(
+        stored_session
+    )
+    if session_restored:
+        _LOGGER.debug("Reusing the stored session for Eldom API '%s'", api)
+
+    coordinator = EldomCoordinator(
+        hass,
+        client,
+        adaptive_polling=entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        ),
+        staggered_polling=entry.options.get(
+            CONF_STAGGERED_POLLING, DEFAULT_STAGGERED_POLLING
+        ),
+        max_staleness=timedelta(
+            seconds=entry.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        ),
+        snapshot_store=snapshot_store(hass, entry.entry_id),
+    )
+
+    eldom_data = EldomData(coordinator)
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = eldom_data
+
+    stored_snapshot = await snapshot_store(hass, entry.entry_id).async_load()
+    if stored_snapshot is not None and coordinator.async_restore_snapshot(
+        stored_snapshot
+    ):
+        # Entities start out from the stored devices, which are fetched in the
+        # background. A missing session is established by the first request.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "Eldom initial refresh"
+        )
+    else:
+        if not session_restored:
+            await client.login()
+            await _async_check_connection(client, api, username)
+
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryAuthFailed:
+            raise
+        except Exception as err:
+            _LOGGER.info("Initial data fetch failed, deferring setup: %s", err)
+            raise ConfigEntryNotReady from err
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    return True
 
-    await client.login()
 
+async def _async_check_connection(
+    client: EldomClientWrapper, api: str, username: str
+) -> None:
+    """Make sure the freshly logged in client can reach the API."""
     try:
         connected = await client.is_connected()
-    except (EldomInvalidCredentialsError, IoTEldomInvalidCredentialsError) as err:
+    except InvalidCredentialsError as err:
         _LOGGER.error(
             "Invalid credentials for Eldom API '%s' for '%s'", api, username
         )
@@ -60,27 +175,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             f"Unexpected exception while authenticating with Eldom API '{api}' for '{username}'"
         )
 
-    coordinator = EldomCoordinator(hass, client)
-
-    eldom_data = EldomData(coordinator)
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = eldom_data
-
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.info("Initial data fetch failed, deferring setup: %s", err)
-        raise ConfigEntryNotReady from err
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    return True
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    hass.data[DOMAIN].pop(entry.entry_id)
+    eldom_data: EldomData = hass.data[DOMAIN].pop(entry.entry_id)
+    await eldom_data.coordinator.async_shutdown()
 
     return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored session and devices of a removed config entry."""
+    await session_store(hass, entry.entry_id).async_remove()
+    await snapshot_store(hass, entry.entry_id).async_remove()
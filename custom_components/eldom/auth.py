@@ -0,0 +1,17 @@
+"""Authentication helpers for the Eldom APIs."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+SESSION_STORAGE_VERSION = 1
+# How long session changes are batched before they're written to disk.
+SESSION_SAVE_DELAY = 10  # seconds
+
+
+def session_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store keeping the authenticated session of a config entry."""
+    return Store(hass, SESSION_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.session")
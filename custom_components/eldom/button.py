@@ -4,14 +4,18 @@ import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .commands import COMMAND_RESET_ENERGY_USAGE
 from .const import DEVICE_TYPE_FLAT_BOILER_ELDOM, DEVICE_TYPE_NATURELA_BOILER_ELDOM, DEVICE_TYPE_SMART_BOILER_ELDOM, DOMAIN
 from .coordinator import EldomCoordinator
+from .device_types import build_entities, register_entity
 from .eldom_boiler import EldomBoiler
+from .entity import EldomEntity
 from .models import EldomData
 
 RESET_ENERGY_USAGE_BUTTON = "Reset Energy Usage Button"
@@ -29,61 +33,40 @@ async def async_setup_entry(
 
     eldom_data: EldomData = hass.data[DOMAIN][config_entry.entry_id]
 
-    await eldom_data.coordinator.async_config_entry_first_refresh()
+    async_add_entities(build_entities(Platform.BUTTON, eldom_data.coordinator))
 
-    entities_to_add = []
 
-    for flat_boiler in eldom_data.coordinator.data.get(
-        DEVICE_TYPE_FLAT_BOILER_ELDOM
-    ).values():
-        entities_to_add.append(
-            ResetEnergyUsageButton(flat_boiler, eldom_data.coordinator)
-        )
-
-    for smart_boiler in eldom_data.coordinator.data.get(
-        DEVICE_TYPE_SMART_BOILER_ELDOM
-    ).values():
-        entities_to_add.append(
-            ResetEnergyUsageButton(smart_boiler, eldom_data.coordinator)
-        )
-
-    for naturela_boiler in eldom_data.coordinator.data.get(
-        DEVICE_TYPE_NATURELA_BOILER_ELDOM
-    ).values():
-        entities_to_add.append(
-            ResetEnergyUsageButton(naturela_boiler, eldom_data.coordinator)
-        )
-
-    async_add_entities(entities_to_add)
-
-
-class ResetEnergyUsageButton(ButtonEntity, CoordinatorEntity):
+@register_entity(
+    Platform.BUTTON,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+)
+class ResetEnergyUsageButton(ButtonEntity, EldomEntity):
     """Button to reset energy usage for an Eldom boiler device."""
 
     def __init__(
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom energy consumption sensor."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, str(self._eldom_boiler.device_id))},
+            identifiers={(DOMAIN, str(self._device.device_id))},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-reset-energy-usage-button"
+        return f"{self._device.device_id}-reset-energy-usage-button"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s {RESET_ENERGY_USAGE_BUTTON}"
+        return f"{self._device.name}'s {RESET_ENERGY_USAGE_BUTTON}"
 
     @property
     def icon(self) -> str:
@@ -92,4 +75,16 @@ class ResetEnergyUsageButton(ButtonEntity, CoordinatorEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._eldom_boiler.reset_energy_usage()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_RESET_ENERGY_USAGE,
+                lambda device: device.reset_energy_usage(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while resetting energy usage: %s", e)
+            raise HomeAssistantError("Error while resetting energy usage") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
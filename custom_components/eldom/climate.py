@@ -9,13 +9,13 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform, UnitOfTemperature
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .commands import COMMAND_OPERATION_MODE
 from .const import (
     DEVICE_TYPE_CONVECTOR_HEATER_ELDOM,
     DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM,
@@ -24,7 +24,9 @@ from .const import (
     MANUFACTURER_NAME,
 )
 from .coordinator import EldomCoordinator
+from .device_types import build_entities, register_entity
 from .eldom_convector import EldomConvectorHeater, IoTEldomConvectorHeater
+from .entity import EldomDeviceEntity
 from .models import EldomData
 
 SUPPORT_FLAGS_CLIMATE = (
@@ -45,24 +47,11 @@ async def async_setup_entry(
 
     eldom_data: EldomData = hass.data[DOMAIN][entry.entry_id]
 
-    await eldom_data.coordinator.async_config_entry_first_refresh()
+    async_add_entities(build_entities(Platform.CLIMATE, eldom_data.coordinator))
 
-    async_add_entities(
-        EldomConvectorHeaterEntity(convector_heater, eldom_data.coordinator)
-        for convector_heater in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_CONVECTOR_HEATER_ELDOM
-        ).values()
-    )
 
-    async_add_entities(
-        IoTEldomConvectorHeaterEntity(convector_heater, eldom_data.coordinator)
-        for convector_heater in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM
-        ).values()
-    )
-
-
-class EldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
+@register_entity(Platform.CLIMATE, DEVICE_TYPE_CONVECTOR_HEATER_ELDOM)
+class EldomConvectorHeaterEntity(ClimateEntity, EldomDeviceEntity):
     """Representation of an Eldom convector heater.
 
     The CoordinatorEntity class provides:
@@ -76,31 +65,29 @@ class EldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
         self, convector_heater: EldomConvectorHeater, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom convector heater."""
-        super().__init__(coordinator)
-
-        self._convector_heater = convector_heater
+        super().__init__(coordinator, convector_heater)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this convector heater."""
         return DeviceInfo(
-            name=self._convector_heater.name,
-            identifiers={(DOMAIN, self._convector_heater.device_id)},
+            name=self._device.name,
+            identifiers={(DOMAIN, self._device.device_id)},
             manufacturer=MANUFACTURER_NAME,
-            model=DEVICE_TYPE_MAPPING.get(self._convector_heater.type),
-            sw_version=str(self._convector_heater.software_version),
-            hw_version=str(self._convector_heater.hardware_version),
+            model=DEVICE_TYPE_MAPPING.get(self._device.type),
+            sw_version=str(self._device.software_version),
+            hw_version=str(self._device.hardware_version),
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return self._convector_heater.device_id
+        return self._device.device_id
 
     @property
     def name(self) -> str:
         """Return the name of the convector heater."""
-        return self._convector_heater.name
+        return self._device.name
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
@@ -115,51 +102,76 @@ class EldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature."""
-        return self._convector_heater.max_temperature
+        return self._device.max_temperature
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature."""
-        return self._convector_heater.min_temperature
+        return self._device.min_temperature
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._convector_heater.current_temperature
+        return self._device.current_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        return self._convector_heater.target_temperature
+        return self._device.target_temperature
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return current operation ie. Off or Heating."""
-        return self._convector_heater.current_operation
+        return self._device.current_operation
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """Return the list of available operation modes."""
-        return self._convector_heater.operation_modes
+        return self._device.operation_modes
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the convector heater on."""
-        await self._convector_heater.turn_on()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_on(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning on: %s", e)
+            raise HomeAssistantError("Error while turning on") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the convector heater off."""
-        await self._convector_heater.turn_off()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_off(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning off: %s", e)
+            raise HomeAssistantError("Error while turning off") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target operation mode."""
         try:
-            await self._convector_heater.set_operation_mode(hvac_mode)
-            self.schedule_update_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.set_operation_mode(hvac_mode),
+            )
+            await self.coordinator.async_refresh_device(
+                self._device.type, self._device.id
+            )
         except Exception as e:
             _LOGGER.error("Error while setting operation mode: %s", e)
             raise HomeAssistantError("Error while setting operation mode") from e
@@ -167,21 +179,22 @@ class EldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get("temperature")
-        await self._convector_heater.set_temperature(temperature)
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._convector_heater = self.coordinator.data.get(
-            self._convector_heater.type
-        ).get(self._convector_heater.id)
+        try:
+            sent = await self.coordinator.async_set_temperature(
+                self._device, temperature
+            )
+        except Exception as e:
+            _LOGGER.error("Error while setting temperature: %s", e)
+            raise HomeAssistantError("Error while setting temperature") from e
 
-        self.async_write_ha_state()
+        if sent:
+            await self.coordinator.async_refresh_device(
+                self._device.type, self._device.id
+            )
 
 
-class IoTEldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
+@register_entity(Platform.CLIMATE, DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM)
+class IoTEldomConvectorHeaterEntity(ClimateEntity, EldomDeviceEntity):
     """Representation of an Eldom convector heater.
 
     The CoordinatorEntity class provides:
@@ -195,29 +208,27 @@ class IoTEldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
         self, convector_heater: IoTEldomConvectorHeater, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom convector heater."""
-        super().__init__(coordinator)
-
-        self._convector_heater = convector_heater
+        super().__init__(coordinator, convector_heater)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this convector heater."""
         return DeviceInfo(
-            name=self._convector_heater.name,
-            identifiers={(DOMAIN, self._convector_heater.device_id)},
+            name=self._device.name,
+            identifiers={(DOMAIN, self._device.device_id)},
             manufacturer=MANUFACTURER_NAME,
-            model=DEVICE_TYPE_MAPPING.get(self._convector_heater.type),
+            model=DEVICE_TYPE_MAPPING.get(self._device.type),
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return self._convector_heater.device_id
+        return self._device.device_id
 
     @property
     def name(self) -> str:
         """Return the name of the convector heater."""
-        return self._convector_heater.name
+        return self._device.name
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
@@ -232,51 +243,76 @@ class IoTEldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature."""
-        return self._convector_heater.max_temperature
+        return self._device.max_temperature
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature."""
-        return self._convector_heater.min_temperature
+        return self._device.min_temperature
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._convector_heater.current_temperature
+        return self._device.current_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        return self._convector_heater.target_temperature
+        return self._device.target_temperature
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return current operation ie. Off or Heating."""
-        return self._convector_heater.current_operation
+        return self._device.current_operation
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """Return the list of available operation modes."""
-        return self._convector_heater.operation_modes
+        return self._device.operation_modes
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the convector heater on."""
-        await self._convector_heater.turn_on()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_on(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning on: %s", e)
+            raise HomeAssistantError("Error while turning on") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the convector heater off."""
-        await self._convector_heater.turn_off()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_off(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning off: %s", e)
+            raise HomeAssistantError("Error while turning off") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target operation mode."""
         try:
-            await self._convector_heater.set_operation_mode(hvac_mode)
-            self.schedule_update_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.set_operation_mode(hvac_mode),
+            )
+            await self.coordinator.async_refresh_device(
+                self._device.type, self._device.id
+            )
         except Exception as e:
             _LOGGER.error("Error while setting operation mode: %s", e)
             raise HomeAssistantError("Error while setting operation mode") from e
@@ -284,15 +320,15 @@ class IoTEldomConvectorHeaterEntity(ClimateEntity, CoordinatorEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get("temperature")
-        await self._convector_heater.set_temperature(temperature)
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._convector_heater = self.coordinator.data.get(
-            self._convector_heater.type
-        ).get(self._convector_heater.id)
-
-        self.async_write_ha_state()
+        try:
+            sent = await self.coordinator.async_set_temperature(
+                self._device, temperature
+            )
+        except Exception as e:
+            _LOGGER.error("Error while setting temperature: %s", e)
+            raise HomeAssistantError("Error while setting temperature") from e
+
+        if sent:
+            await self.coordinator.async_refresh_device(
+                self._device.type, self._device.id
+            )
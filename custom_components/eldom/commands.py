@@ -0,0 +1,244 @@
+"""Command handling for Eldom devices."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .eldom_client import DeviceKey
+
+# How long a setpoint waits for a newer one before it's sent to the device.
+SET_TEMPERATURE_COALESCE_WINDOW = timedelta(milliseconds=500)
+
+# Commands of the same kind replace each other while they wait in a device's
+# queue, as only the last one matters.
+COMMAND_OPERATION_MODE = "operation_mode"
+COMMAND_TEMPERATURE = "temperature"
+COMMAND_POWERFUL_MODE = "powerful_mode"
+COMMAND_RESET_ENERGY_USAGE = "reset_energy_usage"
+
+DeviceCommand = Callable[[Any], Awaitable[None]]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _QueuedCommand:
+    """A command waiting for its turn in a device's queue."""
+
+    kind: str
+    run: DeviceCommand
+    result: asyncio.Future[None]
+
+
+@dataclass
+class _DeviceQueue:
+    """The commands of a single device."""
+
+    commands: deque[_QueuedCommand] = field(default_factory=deque)
+    running: bool = False
+
+    @property
+    def depth(self) -> int:
+        """Return how many commands are queued or running."""
+        return len(self.commands) + self.running
+
+
+class DeviceCommandQueue:
+    """Runs the commands of each device one at a time, in order.
+
+    A command waiting right behind another one of the same kind replaces it,
+    so e.g. two mode changes in a row only send the last one.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        get_device: Callable[[DeviceKey], Any],
+    ) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._get_device = get_device
+        self._queues: dict[DeviceKey, _DeviceQueue] = {}
+        self._workers: set[asyncio.Task] = set()
+
+    def depth(self, device_key: DeviceKey) -> int:
+        """Return how many commands of the device are queued or running."""
+        queue = self._queues.get(device_key)
+        return queue.depth if queue is not None else 0
+
+    def depths(self) -> dict[DeviceKey, int]:
+        """Return the queue depth of every device with pending commands."""
+        return {
+            device_key: queue.depth
+            for device_key, queue in self._queues.items()
+            if queue.depth
+        }
+
+    async def async_run(
+        self, device_key: DeviceKey, kind: str, run: DeviceCommand
+    ) -> None:
+        """Queue a command and wait for it to complete.
+
+        `run` is given the device's current wrapper once it's the command's turn.
+        """
+        queue = self._queues.setdefault(device_key, _DeviceQueue())
+
+        if queue.commands and queue.commands[-1].kind == kind:
+            _LOGGER.debug(
+                "Merging '%s' command for Eldom device '%s'", kind, device_key[1]
+            )
+            command = queue.commands[-1]
+            command.run = run
+        else:
+            command = _QueuedCommand(kind, run, self._hass.loop.create_future())
+            queue.commands.append(command)
+
+        if not queue.running:
+            queue.running = True
+            worker = self._hass.async_create_background_task(
+                self._async_work(device_key, queue), name="Eldom device commands"
+            )
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+        await asyncio.shield(command.result)
+
+    async def _async_work(self, device_key: DeviceKey, queue: _DeviceQueue) -> None:
+        """Run the device's commands until its queue is empty."""
+        try:
+            while queue.commands:
+                command = queue.commands.popleft()
+                try:
+                    await command.run(self._get_device(device_key))
+                except asyncio.CancelledError:
+                    command.result.cancel()
+                    raise
+                except Exception as err:  # noqa: BLE001
+                    command.result.set_exception(err)
+                else:
+                    command.result.set_result(None)
+        finally:
+            queue.running = False
+
+    def cancel(self) -> None:
+        """Stop running commands and drop the queued ones."""
+        for worker in self._workers:
+            worker.cancel()
+
+        for queue in self._queues.values():
+            for command in queue.commands:
+                command.result.cancel()
+
+        self._queues.clear()
+
+
+@dataclass
+class _PendingSetpoint:
+    """A setpoint waiting for the coalescing window to close."""
+
+    temperature: float
+    result: asyncio.Future[None]
+    restore: Callable[[], None]
+    latest_call: object = field(default_factory=object)
+    timer: asyncio.TimerHandle | None = None
+
+
+class SetpointCoalescer:
+    """Coalesces bursts of target temperature changes per device.
+
+    Every change is shown on the device right away. Each change restarts the
+    device's window, and only the last setpoint of a burst is sent once the
+    window closes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        command_queue: DeviceCommandQueue,
+        get_device: Callable[[DeviceKey], Any],
+        window: timedelta = SET_TEMPERATURE_COALESCE_WINDOW,
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._command_queue = command_queue
+        self._get_device = get_device
+        self._window = window.total_seconds()
+        self._pending: dict[DeviceKey, _PendingSetpoint] = {}
+
+    def is_pending(self, device_key: DeviceKey) -> bool:
+        """Return whether a setpoint of the device is waiting to be sent."""
+        return device_key in self._pending
+
+    async def async_set_temperature(
+        self, device_key: DeviceKey, temperature: float
+    ) -> bool:
+        """Set the device's target temperature once the burst it's part of ends.
+
+        Returns whether this call's setpoint was the one sent. Superseded calls
+        wait for the final setpoint and share its outcome. If it fails, the
+        target temperature from before the burst is shown again.
+        """
+        restore = self._get_device(device_key).preview_temperature(temperature)
+
+        pending = self._pending.get(device_key)
+        if pending is None:
+            pending = _PendingSetpoint(
+                temperature, self._hass.loop.create_future(), restore
+            )
+            self._pending[device_key] = pending
+        else:
+            pending.timer.cancel()
+            pending.temperature = temperature
+            pending.latest_call = object()
+
+        call = pending.latest_call
+        pending.timer = self._hass.loop.call_later(
+            self._window, self._send, device_key
+        )
+
+        await asyncio.shield(pending.result)
+
+        return call is pending.latest_call
+
+    def _send(self, device_key: DeviceKey) -> None:
+        """Send the final setpoint of a device's burst."""
+        pending = self._pending.pop(device_key)
+
+        self._hass.async_create_background_task(
+            self._async_send(device_key, pending), name="Eldom set temperature"
+        )
+
+    async def _async_send(
+        self, device_key: DeviceKey, pending: _PendingSetpoint
+    ) -> None:
+        """Send a setpoint and resolve every call waiting for it."""
+        temperature = pending.temperature
+        try:
+            await self._command_queue.async_run(
+                device_key,
+                COMMAND_TEMPERATURE,
+                lambda device: device.set_temperature(temperature),
+            )
+        except asyncio.CancelledError:
+            # The command was dropped on unload, so the callers stop waiting.
+            pending.result.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            pending.restore()
+            pending.result.set_exception(err)
+        else:
+            pending.result.set_result(None)
+
+    def cancel(self) -> None:
+        """Drop the setpoints that haven't been sent yet."""
+        for pending in self._pending.values():
+            pending.timer.cancel()
+            pending.result.cancel()
+
+        self._pending.clear()
@@ -9,10 +9,32 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers import aiohttp_client
 
-from .const import API_CHOICES, CONF_API, DOMAIN, ELDOM_API
-from .eldom_client import EldomClientWrapper
+from .const import (
+    API_CHOICES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_API,
+    CONF_BULK_STATUS,
+    CONF_DEVICE_CACHE_TTL,
+    CONF_HEDGED_REQUESTS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_STALENESS,
+    CONF_RATE_LIMIT,
+    CONF_STAGGERED_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BULK_STATUS,
+    DEFAULT_DEVICE_CACHE_TTL,
+    DEFAULT_HEDGED_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_STAGGERED_POLLING,
+    DOMAIN,
+    ELDOM_API,
+)
+from .eldom_client import EldomClientWrapper, async_import_api_client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,12 +44,21 @@ class EldomConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> EldomOptionsFlow:
+        """Get the options flow for this handler."""
+        return EldomOptionsFlow()
+
     async def _async_validate_credentials(
         self, username: str, password: str, api: str
     ) -> str | None:
         """Validate the credentials. Return an error string, or None if successful."""
         session = aiohttp_client.async_create_clientsession(self.hass)
 
+        await async_import_api_client(self.hass, api)
         client = EldomClientWrapper(session, username, password, api)
 
         await client.login()
@@ -82,3 +113,67 @@ class EldomConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class EldomOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options for Eldom."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                    vol.Required(
+                        CONF_RATE_LIMIT,
+                        default=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=6000)),
+                    vol.Required(
+                        CONF_DEVICE_CACHE_TTL,
+                        default=options.get(
+                            CONF_DEVICE_CACHE_TTL, DEFAULT_DEVICE_CACHE_TTL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+                    vol.Required(
+                        CONF_BULK_STATUS,
+                        default=options.get(CONF_BULK_STATUS, DEFAULT_BULK_STATUS),
+                    ): bool,
+                    vol.Required(
+                        CONF_HEDGED_REQUESTS,
+                        default=options.get(
+                            CONF_HEDGED_REQUESTS, DEFAULT_HEDGED_REQUESTS
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_ADAPTIVE_POLLING,
+                        default=options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_STAGGERED_POLLING,
+                        default=options.get(
+                            CONF_STAGGERED_POLLING, DEFAULT_STAGGERED_POLLING
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_MAX_STALENESS,
+                        default=options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+                }
+            ),
+        )
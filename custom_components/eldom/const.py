@@ -23,6 +23,31 @@ DEVICE_TYPE_MAPPING = {
 }
 
 CONF_API = "api"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_DEVICE_CACHE_TTL = "device_cache_ttl"
+CONF_BULK_STATUS = "bulk_status"
+CONF_HEDGED_REQUESTS = "hedged_requests"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_STAGGERED_POLLING = "staggered_polling"
+CONF_MAX_STALENESS = "max_staleness"
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+DEFAULT_RATE_LIMIT = 0  # requests per minute, 0 disables the limit
+DEFAULT_DEVICE_CACHE_TTL = 60  # minutes
+DEFAULT_BULK_STATUS = False
+DEFAULT_HEDGED_REQUESTS = False
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_STAGGERED_POLLING = False
+DEFAULT_MAX_STALENESS = 120  # seconds
+
+SERVICE_RESCAN_DEVICES = "rescan_devices"
+SERVICE_APPLY = "apply"
+
+ATTR_LAST_REFRESHED = "last_refreshed"
+ATTR_STALE = "stale"
+ATTR_DEVICES = "devices"
+ATTR_OPERATION_MODE = "operation_mode"
 
 ELDOM_API = "myeldom"
 ELDOM_API_URL = "myeldom.com"
@@ -1,17 +1,81 @@
 """The Eldom Coordinator."""
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 import logging
+import math
+import time
+from typing import Any
 
+from homeassistant.const import STATE_OFF
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from .eldom_client import EldomClientWrapper
+from .const import (
+    ATTR_LAST_REFRESHED,
+    ATTR_STALE,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_STAGGERED_POLLING,
+    DOMAIN,
+)
+from .commands import DeviceCommand, DeviceCommandQueue, SetpointCoalescer
+from .eldom_client import (
+    DeviceKey,
+    DevicesUpdate,
+    EldomClientWrapper,
+    InvalidCredentialsError,
+)
+
+UPDATE_INTERVAL = timedelta(seconds=30)
+
+# Adaptive polling intervals, picked after every update based on what the
+# devices are doing.
+UPDATE_INTERVAL_ACTIVE = timedelta(seconds=15)
+UPDATE_INTERVAL_IDLE = timedelta(minutes=2)
+UPDATE_INTERVAL_OFF = timedelta(minutes=5)
+
+# How long polling stays fast after a command was sent to a device.
+RECENT_COMMAND_WINDOW = timedelta(minutes=2)
+
+# Temperature change in degrees per minute that's considered a quick change.
+FAST_TEMPERATURE_CHANGE_RATE = 0.5
+
+# How long the last known state of a device that fails to refresh is served
+# before its entities are made unavailable.
+STALE_DEVICE_MAX_AGE = timedelta(minutes=15)
+
+# How long to wait before retrying the devices that failed to refresh.
+REVALIDATION_DELAY = timedelta(seconds=5)
+
+# Share of the update interval an update may take, up to the maximum. Devices
+# that don't respond in time keep their last known state.
+UPDATE_TIME_BUDGET_RATIO = 0.8
+MAX_UPDATE_TIME_BUDGET = timedelta(seconds=25)
+
+# How many updates in a row may fail before polling backs off, and how far
+# it backs off. While backed off, every update starts with a single probe
+# request.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_OPEN_INTERVAL = timedelta(minutes=1)
+CIRCUIT_BREAKER_MAX_INTERVAL = timedelta(minutes=10)
+
+# The last fetched state of the devices is stored, and entities start out
+# from it after a restart while the devices are fetched again.
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = timedelta(minutes=1)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store keeping the device snapshot of a config entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+
 class EldomCoordinator(DataUpdateCoordinator):
     """Eldom coordinator."""
 
@@ -19,17 +83,599 @@ class EldomCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         eldom_wrapper_client: EldomClientWrapper,
+        adaptive_polling: bool = DEFAULT_ADAPTIVE_POLLING,
+        staggered_polling: bool = DEFAULT_STAGGERED_POLLING,
+        max_staleness: timedelta = timedelta(seconds=DEFAULT_MAX_STALENESS),
+        snapshot_store: Store[dict[str, Any]] | None = None,
     ) -> None:
         """Initialize my coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=UPDATE_INTERVAL,
         )
         self.eldom_wrapper_client = eldom_wrapper_client
+        self.adaptive_polling = adaptive_polling
+        self.staggered_polling = staggered_polling
+        self.max_staleness = max_staleness
+        self._snapshot_store = snapshot_store
+
+        self._device_refreshed_at: dict[DeviceKey, datetime] = {}
+        self._stale_devices: set[DeviceKey] = set()
+        # Devices still served from the stored snapshot, which haven't been
+        # fetched since the integration started.
+        self._snapshot_device_keys: set[DeviceKey] = set()
+        # The devices the entities were created for from the stored snapshot,
+        # until the account's devices have been listed once.
+        self._restored_device_keys: set[DeviceKey] | None = None
+        self._revalidation_task: asyncio.Task | None = None
+        self._last_command_at: float | None = None
+        self._temperature_samples: dict[str, tuple[float, float]] = {}
+        self._consecutive_failures = 0
+        self._circuit_open = False
+        self._commands = DeviceCommandQueue(hass, self._get_device)
+        self._setpoints = SetpointCoalescer(hass, self._commands, self._get_device)
 
     async def _async_update_data(self) -> dict:
         """Fetch data from Eldom."""
 
-        return await self.eldom_wrapper_client.get_devices()
+        deadline = self.hass.loop.time() + self._update_time_budget()
+
+        try:
+            if self._circuit_open:
+                await self._async_probe(deadline)
+
+            return await self._async_poll(deadline)
+        except InvalidCredentialsError as err:
+            raise ConfigEntryAuthFailed(
+                f"Invalid credentials for Eldom API '{self.eldom_wrapper_client.api}'"
+            ) from err
+        except Exception as err:
+            self._record_failure()
+
+            # Entities started from the stored snapshot keep showing it, marked
+            # as stale, until their devices can be fetched.
+            if self._snapshot_device_keys and self.data is not None:
+                _LOGGER.warning(
+                    "Failed to fetch Eldom devices, showing their stored state: %s",
+                    err,
+                )
+                return self.data
+
+            raise
+
+    async def _async_poll(self, deadline: float) -> dict:
+        """Fetch the devices that are due and merge them into the data."""
+
+        # Devices with commands in flight aren't fetched, as the poll could
+        # return their state from before the command.
+        busy_device_keys = {
+            device_key
+            for device_key in self._device_keys()
+            if self._has_commands_in_flight(device_key)
+        }
+        if busy_device_keys:
+            _LOGGER.debug(
+                "Skipping %d Eldom devices with commands in flight",
+                len(busy_device_keys),
+            )
+
+        if self.staggered_polling and self.data is not None:
+            update = await self._async_update_staggered_data(
+                deadline, busy_device_keys
+            )
+        else:
+            update = await self.eldom_wrapper_client.get_devices(
+                deadline=deadline, exclude=busy_device_keys
+            )
+
+        # Entities are only created for the devices fetched by the first
+        # refresh, so it fails, and the setup is retried, until all of them can
+        # be fetched.
+        if self.data is None and update.failures:
+            raise UpdateFailed(
+                f"Failed to fetch {len(update.failures)} of"
+                f" {len(update.device_keys)} Eldom devices"
+            )
+
+        data = self._merge_update(update)
+        self._save_snapshot()
+
+        if self._restored_device_keys is not None:
+            self._check_restored_devices(update)
+
+        if update.failures:
+            self._schedule_revalidation(set(update.failures))
+
+        # An update where every fetched device failed counts as a failure,
+        # even if the devices' last known state could still be served.
+        if update.failures and not any(update.devices.values()):
+            self._record_failure()
+        else:
+            self._record_success()
+
+        if self.adaptive_polling and not self._circuit_open:
+            self.update_interval = self._next_update_interval(data)
+
+        return data
+
+    async def _async_probe(self, deadline: float) -> None:
+        """Check whether the Eldom API recovered with a single request.
+
+        Raises UpdateFailed, and keeps the circuit open, if it didn't. Rejected
+        credentials are raised as they are, so they still start reauthentication.
+        """
+        self.eldom_wrapper_client.invalidate_device_inventory()
+
+        try:
+            await self.eldom_wrapper_client.get_device_keys(deadline)
+        except InvalidCredentialsError:
+            raise
+        except Exception as err:
+            raise UpdateFailed("Eldom API is still unavailable") from err
+
+        _LOGGER.info("Eldom API is available again, resuming regular polling")
+        self._record_success()
+
+    def _record_success(self) -> None:
+        """Reset the failure count and close the circuit if it's open."""
+        self._consecutive_failures = 0
+
+        if self._circuit_open:
+            self._circuit_open = False
+            self.update_interval = UPDATE_INTERVAL
+
+    def _record_failure(self) -> None:
+        """Count a failed update and open the circuit after too many in a row.
+
+        While the circuit is open, every further failure doubles the update
+        interval, up to the maximum.
+        """
+        self._consecutive_failures += 1
+        if self._consecutive_failures < CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            return
+
+        if not self._circuit_open:
+            _LOGGER.warning(
+                "Eldom API failed %d updates in a row, polling less often until it "
+                "recovers",
+                self._consecutive_failures,
+            )
+            self._circuit_open = True
+
+        backoff = 2 ** (self._consecutive_failures - CIRCUIT_BREAKER_FAILURE_THRESHOLD)
+        self.update_interval = min(
+            CIRCUIT_BREAKER_OPEN_INTERVAL * backoff, CIRCUIT_BREAKER_MAX_INTERVAL
+        )
+
+    def _update_time_budget(self) -> float:
+        """Return how many seconds an update may take."""
+        interval = (self.update_interval or UPDATE_INTERVAL).total_seconds()
+
+        return min(
+            interval * UPDATE_TIME_BUDGET_RATIO,
+            MAX_UPDATE_TIME_BUDGET.total_seconds(),
+        )
+
+    async def _async_update_staggered_data(
+        self, deadline: float, busy_device_keys: set[DeviceKey]
+    ) -> DevicesUpdate:
+        """Refresh a rotating subset of the devices.
+
+        The least recently refreshed devices go first, and enough of them are
+        picked on every update for each device to be refreshed at least once
+        within the maximum staleness.
+        """
+        device_keys = [
+            device_key
+            for device_key in await self.eldom_wrapper_client.get_device_keys(deadline)
+            if device_key not in busy_device_keys
+        ]
+        if not device_keys:
+            return await self.eldom_wrapper_client.get_devices(
+                deadline=deadline, exclude=busy_device_keys
+            )
+
+        interval = (self.update_interval or UPDATE_INTERVAL).total_seconds()
+        max_staleness = self.max_staleness.total_seconds()
+
+        devices_per_update = min(
+            len(device_keys),
+            max(1, math.ceil(len(device_keys) * interval / max_staleness)),
+        )
+        by_staleness = sorted(device_keys, key=self._device_age, reverse=True)
+        keys_to_refresh = set(by_staleness[:devices_per_update])
+        # Devices that would otherwise outlive the bound before their next turn.
+        keys_to_refresh.update(
+            key
+            for key in by_staleness[devices_per_update:]
+            if self._device_age(key) + interval > max_staleness
+        )
+
+        _LOGGER.debug(
+            "Refreshing %d of %d Eldom devices", len(keys_to_refresh), len(device_keys)
+        )
+
+        return await self.eldom_wrapper_client.get_devices(
+            keys_to_refresh, deadline=deadline, exclude=busy_device_keys
+        )
+
+    def _merge_update(self, update: DevicesUpdate) -> dict:
+        """Merge the fetched devices with the last known state of the others.
+
+        Devices that weren't fetched or have commands in flight keep their last
+        known state. So do devices that failed to refresh, which are marked as
+        stale. A device that has never been fetched is left out until it is.
+        """
+        now = dt_util.utcnow()
+        previous_data = self.data or {}
+
+        data: dict = {device_type: {} for device_type in update.devices}
+        for device_key in update.device_keys:
+            device_type, device_id = device_key
+
+            previous_device = previous_data.get(device_type, {}).get(device_id)
+            device = update.devices[device_type].get(device_id)
+            if previous_device is not None and self._has_commands_in_flight(
+                device_key
+            ):
+                # The predicted state is kept until the command completes and
+                # the device is refreshed again.
+                device = previous_device
+            elif device is not None:
+                device.state_listener = self.async_update_listeners
+                self._device_refreshed_at[device_key] = now
+                self._stale_devices.discard(device_key)
+                self._snapshot_device_keys.discard(device_key)
+            else:
+                device = previous_device
+
+            if device_key in update.failures:
+                self._stale_devices.add(device_key)
+
+            if device is not None:
+                data[device_type][device_id] = device
+
+        self._snapshot_device_keys.intersection_update(update.device_keys)
+
+        return data
+
+    def _check_restored_devices(self, update: DevicesUpdate) -> None:
+        """Reload the entry if the account's devices differ from the snapshot.
+
+        The entities were created for the stored devices, so devices added to or
+        removed from the account since then only get or lose their entities
+        once the entry is reloaded. Added devices are waited for until they've
+        been fetched, as they only get entities once they're in the data.
+        """
+        device_keys = self._device_keys()
+        if device_keys != self._restored_device_keys:
+            self._restored_device_keys = None
+
+            _LOGGER.info("Eldom devices changed, reloading to update entities")
+            self.hass.config_entries.async_schedule_reload(
+                self.config_entry.entry_id
+            )
+        elif device_keys == set(update.device_keys):
+            self._restored_device_keys = None
+
+    def _device_age(self, device_key: DeviceKey) -> float:
+        """Return how many seconds ago the device was last refreshed."""
+        refreshed_at = self._device_refreshed_at.get(device_key)
+        if refreshed_at is None:
+            return math.inf
+
+        return (dt_util.utcnow() - refreshed_at).total_seconds()
+
+    def _schedule_revalidation(self, device_keys: set[DeviceKey]) -> None:
+        """Retry the devices that failed to refresh in the background."""
+        if self._revalidation_task is not None and not self._revalidation_task.done():
+            return
+
+        self._revalidation_task = self.hass.async_create_background_task(
+            self._async_revalidate(device_keys), name="Eldom device revalidation"
+        )
+
+    async def _async_revalidate(self, device_keys: set[DeviceKey]) -> None:
+        """Refresh the given devices and push their state to the entities."""
+        await asyncio.sleep(REVALIDATION_DELAY.total_seconds())
+
+        try:
+            update = await self.eldom_wrapper_client.get_devices(device_keys)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Revalidating stale Eldom devices failed: %s", err)
+            return
+
+        self._apply_update(update)
+
+    async def async_refresh_device(
+        self, device_type: int | str, device_id: int | str
+    ) -> None:
+        """Refresh a single device after a command was sent to it.
+
+        Only the commanded device's status is fetched, so confirming a command
+        costs the same no matter how many devices are on the account.
+        """
+        self._record_command()
+
+        try:
+            device = await self.eldom_wrapper_client.get_device(
+                (device_type, device_id)
+            )
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Refreshing Eldom device '%s' failed: %s", device_id, err)
+            return
+
+        if device is not None:
+            self._apply_devices([(device_type, device_id, device)])
+
+    async def async_refresh_devices(self, device_keys: set[DeviceKey]) -> None:
+        """Refresh several devices at once after commands were sent to them."""
+        self._record_command()
+
+        try:
+            update = await self.eldom_wrapper_client.get_devices(device_keys)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Refreshing commanded Eldom devices failed: %s", err)
+            return
+
+        self._apply_update(update)
+
+    async def async_set_temperature(self, device: Any, temperature: float) -> bool:
+        """Set a device's target temperature, coalescing bursts of changes.
+
+        Returns whether this setpoint was sent, rather than superseded by a
+        newer one for the same device.
+        """
+        return await self._setpoints.async_set_temperature(
+            (device.type, device.id), temperature
+        )
+
+    async def async_run_command(
+        self, device: Any, kind: str, command: DeviceCommand
+    ) -> None:
+        """Run a command once the device's earlier commands have completed.
+
+        The command is given the device's current wrapper when it runs. It
+        replaces a queued command of the same kind that hasn't started yet.
+        """
+        await self._commands.async_run((device.type, device.id), kind, command)
+
+    def _has_commands_in_flight(self, device_key: DeviceKey) -> bool:
+        """Return whether a command to the device is pending, queued or running."""
+        if self._commands.depth(device_key) or self._setpoints.is_pending(device_key):
+            return True
+
+        device_type, device_id = device_key
+        device = (self.data or {}).get(device_type, {}).get(device_id)
+        return device is not None and device.has_commands_in_flight
+
+    def command_queue_depths(self) -> dict[DeviceKey, int]:
+        """Return how many commands are queued or running for each device."""
+        return self._commands.depths()
+
+    def _get_device(self, device_key: DeviceKey) -> Any:
+        """Return the current wrapper of a device."""
+        device_type, device_id = device_key
+        return self.data[device_type][device_id]
+
+    def _apply_update(self, update: DevicesUpdate) -> None:
+        """Push the devices fetched outside of a regular update to the entities."""
+        self._apply_devices(
+            [
+                (device_type, device_id, device)
+                for device_type, devices in update.devices.items()
+                for device_id, device in devices.items()
+            ]
+        )
+
+    def _apply_devices(self, devices: list[tuple[int | str, int | str, Any]]) -> None:
+        """Merge freshly fetched devices into the data and push it to the entities."""
+        if self.data is None or not devices:
+            return
+
+        now = dt_util.utcnow()
+        for device_type, device_id, device in devices:
+            if self._has_commands_in_flight((device_type, device_id)):
+                continue
+
+            device.state_listener = self.async_update_listeners
+            self.data.setdefault(device_type, {})[device_id] = device
+            self._device_refreshed_at[(device_type, device_id)] = now
+            self._stale_devices.discard((device_type, device_id))
+            self._snapshot_device_keys.discard((device_type, device_id))
+
+        self._save_snapshot()
+        self.async_update_listeners()
+
+    def current_device(self, device: Any) -> Any:
+        """Return the current wrapper of a device, or the given one if it's gone."""
+        return (self.data or {}).get(device.type, {}).get(device.id, device)
+
+    def device_available(self, device: Any) -> bool:
+        """Return whether the device's entities should be available.
+
+        A device that fails to refresh stays available with its last known
+        state until that state is too old, without affecting other devices.
+        Devices restored from the stored snapshot stay available until they're
+        fetched.
+        """
+        device_key = (device.type, device.id)
+        if device.id not in (self.data or {}).get(device.type, {}):
+            return False
+
+        return (
+            device_key not in self._stale_devices
+            or device_key in self._snapshot_device_keys
+            or self._device_age(device_key) <= STALE_DEVICE_MAX_AGE.total_seconds()
+        )
+
+    def device_freshness(
+        self, device_type: int | str, device_id: int | str
+    ) -> dict[str, Any]:
+        """Return when a device was last refreshed and whether its state is stale."""
+        device_key = (device_type, device_id)
+
+        return {
+            ATTR_LAST_REFRESHED: self._device_refreshed_at.get(device_key),
+            ATTR_STALE: device_key in self._stale_devices,
+        }
+
+    def async_restore_snapshot(self, snapshot: dict[str, Any]) -> bool:
+        """Start out from the stored snapshot of the devices.
+
+        The restored devices are marked as stale until they're fetched again.
+        Returns whether the snapshot could be restored.
+        """
+        client = self.eldom_wrapper_client
+        if snapshot.get("api") != client.api:
+            return False
+
+        data: dict = {}
+        refreshed_at: dict[DeviceKey, datetime] = {}
+        try:
+            for stored_device in snapshot["devices"]:
+                device_key, device = client.restore_device(stored_device)
+                device.state_listener = self.async_update_listeners
+
+                device_type, device_id = device_key
+                data.setdefault(device_type, {})[device_id] = device
+                if stored_refreshed_at := dt_util.parse_datetime(
+                    stored_device["refreshed_at"]
+                ):
+                    refreshed_at[device_key] = stored_refreshed_at
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring the stored Eldom device snapshot: %s", err)
+            return False
+
+        if not data:
+            return False
+
+        _LOGGER.debug("Starting out from %d stored Eldom devices", len(refreshed_at))
+
+        self.data = data
+        self._device_refreshed_at.update(refreshed_at)
+        self._snapshot_device_keys = self._device_keys()
+        self._restored_device_keys = set(self._snapshot_device_keys)
+        self._stale_devices.update(self._snapshot_device_keys)
+
+        return True
+
+    def _save_snapshot(self) -> None:
+        """Schedule storing the current state of the devices."""
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_delay_save(
+                self._export_snapshot, SNAPSHOT_SAVE_DELAY.total_seconds()
+            )
+
+    def _export_snapshot(self) -> dict[str, Any]:
+        """Return the current state of the devices in a form that can be stored."""
+        devices = []
+        for device_key in self._device_keys():
+            stored_device = self.eldom_wrapper_client.export_device(device_key)
+            refreshed_at = self._device_refreshed_at.get(device_key)
+            if stored_device is None or refreshed_at is None:
+                continue
+
+            devices.append({**stored_device, "refreshed_at": refreshed_at.isoformat()})
+
+        return {"api": self.eldom_wrapper_client.api, "devices": devices}
+
+    async def async_shutdown(self) -> None:
+        """Cancel the background work of the coordinator."""
+        if self._revalidation_task is not None:
+            self._revalidation_task.cancel()
+
+        self._setpoints.cancel()
+        self._commands.cancel()
+
+        await super().async_shutdown()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh after a command was sent to a device.
+
+        Entities only request refreshes to confirm commands, so this also keeps
+        adaptive polling fast for a while.
+        """
+        self._record_command()
+
+        await super().async_request_refresh()
+
+    def _record_command(self) -> None:
+        """Remember that a command was sent and speed up adaptive polling."""
+        self._last_command_at = time.monotonic()
+
+        if self.adaptive_polling and self.update_interval != UPDATE_INTERVAL_ACTIVE:
+            self.update_interval = UPDATE_INTERVAL_ACTIVE
+            self._schedule_refresh()
+
+    async def async_rescan_devices(self) -> bool:
+        """Re-list the account's devices and return whether the device set changed."""
+        known_devices = self._device_keys()
+
+        self.eldom_wrapper_client.invalidate_device_inventory()
+        await self.async_refresh()
+
+        return self._device_keys() != known_devices
+
+    def _device_keys(self) -> set[tuple]:
+        """Return the (type, ID) pairs of all devices in the current data."""
+        return {
+            (device_type, device_id)
+            for device_type, devices in (self.data or {}).items()
+            for device_id in devices
+        }
+
+    def _next_update_interval(self, data: dict) -> timedelta:
+        """Pick the next update interval based on what the devices are doing.
+
+        Polling is fast while a device is heating, was recently commanded or its
+        temperature changes quickly. It backs off while everything is idle and
+        even further while everything is off.
+        """
+        now = time.monotonic()
+        devices = [device for devices in data.values() for device in devices.values()]
+
+        previous_samples = self._temperature_samples
+        self._temperature_samples = {
+            device.device_id: (now, device.current_temperature) for device in devices
+        }
+
+        recently_commanded = (
+            self._last_command_at is not None
+            and now - self._last_command_at < RECENT_COMMAND_WINDOW.total_seconds()
+        )
+        heating = any(device.heater_enabled for device in devices)
+        changing_quickly = self._temperature_changing_quickly(previous_samples)
+
+        if recently_commanded or heating or changing_quickly:
+            interval = UPDATE_INTERVAL_ACTIVE
+        elif all(device.current_operation == STATE_OFF for device in devices):
+            interval = UPDATE_INTERVAL_OFF
+        else:
+            interval = UPDATE_INTERVAL_IDLE
+
+        if interval != self.update_interval:
+            _LOGGER.debug("Eldom update interval changed to %s", interval)
+
+        return interval
+
+    def _temperature_changing_quickly(
+        self, previous_samples: dict[str, tuple[float, float]]
+    ) -> bool:
+        """Return whether any device's temperature changed quickly since the last update."""
+        for device_id, (sampled_at, temperature) in self._temperature_samples.items():
+            if device_id not in previous_samples:
+                continue
+
+            previous_sampled_at, previous_temperature = previous_samples[device_id]
+            elapsed_minutes = (sampled_at - previous_sampled_at) / 60
+            if elapsed_minutes <= 0:
+                continue
+
+            change_rate = abs(temperature - previous_temperature) / elapsed_minutes
+            if change_rate >= FAST_TEMPERATURE_CHANGE_RATE:
+                return True
+
+        return False
@@ -0,0 +1,151 @@
+"""Registry of the Eldom device types supported by the integration."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import Platform
+from homeassistant.helpers.entity import Entity
+
+from .const import (
+    DEVICE_TYPE_CONVECTOR_HEATER_ELDOM,
+    DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    ELDOM_API,
+    IOT_ELDOM_API,
+)
+from .eldom_boiler import (
+    FlatEldomBoiler,
+    FlatIoTEldomBoiler,
+    NaturelaEldomBoiler,
+    SmartEldomBoiler,
+)
+from .eldom_convector import EldomConvectorHeater, IoTEldomConvectorHeater
+
+if TYPE_CHECKING:
+    from .coordinator import EldomCoordinator
+
+EntityFactory = Callable[[Any, "EldomCoordinator"], Entity]
+
+
+@dataclass(frozen=True, kw_only=True)
+class EldomDeviceType:
+    """Describes how a device type is fetched, wrapped and turned into entities."""
+
+    api: str
+    """The Eldom API the device type is managed by."""
+    get_status: Callable[[Any, Any], Awaitable[Any]]
+    """Fetches the device's details given the API client and the listed device."""
+    create: Callable[[Any, Any, Any], Any]
+    """Builds the device wrapper given the listed device, its details and the API client."""
+    status_model: str
+    """The name of the device's details model in its API's models module."""
+    entity_factories: dict[Platform, list[EntityFactory]] = field(
+        default_factory=dict
+    )
+    """The entities to create for each device, filled in by `register_entity`."""
+
+
+DEVICE_TYPES: dict[int | str, EldomDeviceType] = {
+    # Eldom devices
+    DEVICE_TYPE_FLAT_BOILER_ELDOM: EldomDeviceType(
+        api=ELDOM_API,
+        get_status=lambda client, device: (
+            client.flat_boiler.get_flat_boiler_status(device.id)
+        ),
+        create=lambda device, details, client: (
+            FlatEldomBoiler(device.id, details, client)
+        ),
+        status_model="FlatBoilerDetails",
+    ),
+    DEVICE_TYPE_SMART_BOILER_ELDOM: EldomDeviceType(
+        api=ELDOM_API,
+        get_status=lambda client, device: (
+            client.smart_boiler.get_smart_boiler_status(device.id)
+        ),
+        create=lambda device, details, client: (
+            SmartEldomBoiler(device.id, details, client)
+        ),
+        status_model="SmartBoilerDetails",
+    ),
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM: EldomDeviceType(
+        api=ELDOM_API,
+        get_status=lambda client, device: (
+            client.naturela_boiler.get_naturela_boiler_status(device.id)
+        ),
+        create=lambda device, details, client: (
+            NaturelaEldomBoiler(device.id, details, client)
+        ),
+        status_model="NaturelaBoilerDetails",
+    ),
+    DEVICE_TYPE_CONVECTOR_HEATER_ELDOM: EldomDeviceType(
+        api=ELDOM_API,
+        get_status=lambda client, device: (
+            client.convector_heater.get_convector_heater_status(device.id)
+        ),
+        create=lambda device, details, client: (
+            EldomConvectorHeater(device.id, details, client)
+        ),
+        status_model="ConvectorHeaterDetails",
+    ),
+    # IoT Eldom devices
+    DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM: EldomDeviceType(
+        api=IOT_ELDOM_API,
+        get_status=lambda client, device: (
+            client.convector_heater.get_convector_heater_status(device)
+        ),
+        create=IoTEldomConvectorHeater,
+        status_model="ConvectorHeaterDetails",
+    ),
+    DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM: EldomDeviceType(
+        api=IOT_ELDOM_API,
+        get_status=lambda client, device: (
+            client.flat_boiler.get_flat_boiler_status(device)
+        ),
+        create=FlatIoTEldomBoiler,
+        status_model="FlatBoilerDetails",
+    ),
+}
+
+
+def classify_device(api: str, device: Any) -> tuple[int | str, int | str]:
+    """Return the device type and the ID a listed device is keyed by."""
+    if api == ELDOM_API:
+        return device.deviceType, device.id
+
+    if api == IOT_ELDOM_API:
+        return device.model, device.uuid
+
+    raise ValueError("Invalid API")
+
+
+def register_entity(
+    platform: Platform, *device_types: int | str
+) -> Callable[[type[Entity]], type[Entity]]:
+    """Register an entity class to be created for each device of the given types."""
+
+    def decorator(entity_class: type[Entity]) -> type[Entity]:
+        for device_type in device_types:
+            DEVICE_TYPES[device_type].entity_factories.setdefault(platform, []).append(
+                entity_class
+            )
+        return entity_class
+
+    return decorator
+
+
+def build_entities(platform: Platform, coordinator: EldomCoordinator) -> list[Entity]:
+    """Create the platform's entities for every device in the coordinator's data."""
+    return [
+        entity_factory(device, coordinator)
+        for device_type, devices in coordinator.data.items()
+        for device in devices.values()
+        for entity_factory in DEVICE_TYPES[device_type].entity_factories.get(
+            platform, []
+        )
+    ]
@@ -0,0 +1,42 @@
+"""Diagnostics support for Eldom."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import EldomData
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    eldom_data: EldomData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = eldom_data.coordinator
+    scheduler = coordinator.eldom_wrapper_client.scheduler
+
+    return {
+        "options": dict(entry.options),
+        "update_interval": str(coordinator.update_interval),
+        "devices": {
+            str(device_type): list(devices)
+            for device_type, devices in (coordinator.data or {}).items()
+        },
+        "requests_waiting": scheduler.waiting,
+        "rate_limiter": (
+            {
+                "requests_per_minute": scheduler.rate_limiter.rate * 60,
+                "capacity": scheduler.rate_limiter.capacity,
+                "fill_level": scheduler.rate_limiter.fill_level,
+                "wait_time": scheduler.rate_limiter.wait_time,
+            }
+            if scheduler.rate_limiter is not None
+            else None
+        ),
+        "command_queue_depths": {
+            str(device_id): depth
+            for (_, device_id), depth in coordinator.command_queue_depths().items()
+        },
+    }
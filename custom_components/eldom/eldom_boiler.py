@@ -1,16 +1,12 @@
 """Eldom boiler objects."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 import asyncio
+from datetime import timedelta
 import logging
-
-from eldom.client import Client as EldomClient
-from eldom.models import FlatBoilerDetails, NaturelaBoilerDetails, SmartBoilerDetails
-from ioteldom.client import Client as IoTEldomClient
-from ioteldom.models import (
-    Device as IoTEldomDevice,
-    FlatBoilerDetails as IoTFlatBoilerDetails,
-)
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.water_heater import (
     STATE_ECO,
@@ -20,12 +16,33 @@ from homeassistant.components.water_heater import (
 )
 from homeassistant.const import STATE_OFF
 
+from .optimistic import OptimisticDevice, OptimisticSetpointDevice
+
+if TYPE_CHECKING:
+    from eldom.client import Client as EldomClient
+    from eldom.models import (
+        FlatBoilerDetails,
+        NaturelaBoilerDetails,
+        SmartBoilerDetails,
+    )
+    from ioteldom.client import Client as IoTEldomClient
+    from ioteldom.models import (
+        Device as IoTEldomDevice,
+        FlatBoilerDetails as IoTFlatBoilerDetails,
+    )
+
 MAX_TEMP = 75
 MIN_TEMP = 35
 
 NATURELA_MAX_TEMP = 75
 NATURELA_MIN_TEMP = 8
 
+# How the boiler's status is polled to confirm it turned off while powerful
+# mode is being disabled.
+OFF_CONFIRMATION_INITIAL_DELAY = timedelta(milliseconds=250)
+OFF_CONFIRMATION_MAX_DELAY = timedelta(seconds=2)
+OFF_CONFIRMATION_TIMEOUT = timedelta(seconds=15)
+
 ELDOM_OPERATION_MODES = {
     0: STATE_OFF,
     1: STATE_ELECTRIC,  # Matches: "Heating"
@@ -50,7 +67,7 @@ NATURELA_OPERATION_MODES = {
 _LOGGER = logging.getLogger(__name__)
 
 
-class EldomBoiler(ABC):
+class EldomBoiler(OptimisticSetpointDevice, ABC):
     """A base class representation of an Eldom boiler."""
 
     @abstractmethod
@@ -153,6 +170,40 @@ class EldomBoiler(ABC):
     async def reset_energy_usage(self) -> None:
         """Reset the energy usage of the boiler."""
 
+    async def _wait_until_off(self) -> None:
+        """Poll the boiler's own status with a backoff until it reports being off.
+
+        Gives up with a warning once the confirmation timeout is reached. No
+        request slot is held while waiting between polls.
+        """
+        if self.device_fetcher is None:
+            return
+
+        delay = OFF_CONFIRMATION_INITIAL_DELAY.total_seconds()
+        try:
+            async with asyncio.timeout(OFF_CONFIRMATION_TIMEOUT.total_seconds()):
+                while True:
+                    await asyncio.sleep(delay)
+
+                    try:
+                        device = await self.device_fetcher()
+                    except Exception as e:  # noqa: BLE001
+                        _LOGGER.debug("Error while confirming the boiler is off: %s", e)
+                    else:
+                        if (
+                            device is not None
+                            and device.current_operation == STATE_OFF
+                        ):
+                            return
+
+                    delay = min(delay * 2, OFF_CONFIRMATION_MAX_DELAY.total_seconds())
+        except TimeoutError:
+            _LOGGER.warning(
+                "Boiler '%s' wasn't confirmed to be off within %s",
+                self.device_id,
+                OFF_CONFIRMATION_TIMEOUT,
+            )
+
 
 class FlatEldomBoiler(EldomBoiler):
     """An Eldom flat boiler representation object."""
@@ -277,19 +328,28 @@ class FlatEldomBoiler(EldomBoiler):
             operation_mode
         ]
 
-        self._flat_boiler_details.State = operation_mode_id
+        async with self._predict(self._flat_boiler_details, State=operation_mode_id):
+            await self._send(
+                self._eldom_client.flat_boiler.set_flat_boiler_state,
+                self.device_id,
+                operation_mode_id,
+            )
 
-        await self._eldom_client.flat_boiler.set_flat_boiler_state(
-            self.device_id, operation_mode_id
-        )
+    def _temperature_prediction(
+        self, temperature: float
+    ) -> tuple[Any, dict[str, Any]]:
+        """Return the details and the fields a new target temperature changes."""
+        return self._flat_boiler_details, {"SetTemp": temperature}
 
     async def set_temperature(self, temperature: float) -> None:
         """Set the temperature of the boiler."""
-        self._flat_boiler_details.SetTemp = temperature
-
-        await self._eldom_client.flat_boiler.set_flat_boiler_temperature(
-            self.device_id, temperature
-        )
+        details, changes = self._temperature_prediction(temperature)
+        async with self._predict(details, **changes):
+            await self._send(
+                self._eldom_client.flat_boiler.set_flat_boiler_temperature,
+                self.device_id,
+                temperature,
+            )
 
     async def enable_powerful_mode(self) -> None:
         """Enable the boiler's powerful mode."""
@@ -303,28 +363,28 @@ class FlatEldomBoiler(EldomBoiler):
             )
             return
 
-        self._flat_boiler_details.HasBoost = True
-
-        await self._eldom_client.flat_boiler.set_flat_boiler_powerful_mode_on(
-            self.device_id
-        )
+        async with self._predict(self._flat_boiler_details, HasBoost=True):
+            await self._send(
+                self._eldom_client.flat_boiler.set_flat_boiler_powerful_mode_on,
+                self.device_id,
+            )
 
     async def disable_powerful_mode(self) -> None:
         """Disable the boiler's powerful mode."""
         previous_mode = self.current_operation
         await self.turn_off()
-        await asyncio.sleep(1)
+        await self._wait_until_off()
         await self.set_operation_mode(previous_mode)
 
     async def reset_energy_usage(self) -> None:
         """Reset the energy usage of the boiler."""
-        self._flat_boiler_details.EnergyD = 0.0
-        self._flat_boiler_details.EnergyN = 0.0
-        self._flat_boiler_details.SavedEnergy = 0
-
-        await self._eldom_client.flat_boiler.reset_flat_boiler_energy_usage(
-            self.device_id
-        )
+        async with self._predict(
+            self._flat_boiler_details, EnergyD=0.0, EnergyN=0.0, SavedEnergy=0
+        ):
+            await self._send(
+                self._eldom_client.flat_boiler.reset_flat_boiler_energy_usage,
+                self.device_id,
+            )
 
 
 class SmartEldomBoiler(EldomBoiler):
@@ -448,19 +508,28 @@ class SmartEldomBoiler(EldomBoiler):
             operation_mode
         ]
 
-        self._smart_boiler_details.State = operation_mode_id
+        async with self._predict(self._smart_boiler_details, State=operation_mode_id):
+            await self._send(
+                self._eldom_client.smart_boiler.set_smart_boiler_state,
+                self.device_id,
+                operation_mode_id,
+            )
 
-        await self._eldom_client.smart_boiler.set_smart_boiler_state(
-            self.device_id, operation_mode_id
-        )
+    def _temperature_prediction(
+        self, temperature: float
+    ) -> tuple[Any, dict[str, Any]]:
+        """Return the details and the fields a new target temperature changes."""
+        return self._smart_boiler_details, {"SetTemp": temperature}
 
     async def set_temperature(self, temperature: float) -> None:
         """Set the temperature of the boiler."""
-        self._smart_boiler_details.SetTemp = temperature
-
-        await self._eldom_client.smart_boiler.set_smart_boiler_temperature(
-            self.device_id, temperature
-        )
+        details, changes = self._temperature_prediction(temperature)
+        async with self._predict(details, **changes):
+            await self._send(
+                self._eldom_client.smart_boiler.set_smart_boiler_temperature,
+                self.device_id,
+                temperature,
+            )
 
     async def enable_powerful_mode(self) -> None:
         """Enable the boiler's powerful mode."""
@@ -469,28 +538,28 @@ class SmartEldomBoiler(EldomBoiler):
             _LOGGER.warning("Powerful mode can only be turned on when in Eco mode")
             return
 
-        self._smart_boiler_details.BoostHeating = True
-
-        await self._eldom_client.smart_boiler.set_smart_boiler_powerful_mode_on(
-            self.device_id
-        )
+        async with self._predict(self._smart_boiler_details, BoostHeating=True):
+            await self._send(
+                self._eldom_client.smart_boiler.set_smart_boiler_powerful_mode_on,
+                self.device_id,
+            )
 
     async def disable_powerful_mode(self) -> None:
         """Disable the boiler's powerful mode."""
         previous_mode = self.current_operation
         await self.turn_off()
-        await asyncio.sleep(1)
+        await self._wait_until_off()
         await self.set_operation_mode(previous_mode)
 
     async def reset_energy_usage(self) -> None:
         """Reset the energy usage of the boiler."""
-        self._smart_boiler_details.EnergyD = 0.0
-        self._smart_boiler_details.EnergyN = 0.0
-        self._smart_boiler_details.SavedEnergy = 0
-
-        await self._eldom_client.smart_boiler.reset_smart_boiler_energy_usage(
-            self.device_id
-        )
+        async with self._predict(
+            self._smart_boiler_details, EnergyD=0.0, EnergyN=0.0, SavedEnergy=0
+        ):
+            await self._send(
+                self._eldom_client.smart_boiler.reset_smart_boiler_energy_usage,
+                self.device_id,
+            )
 
 
 class NaturelaEldomBoiler(EldomBoiler):
@@ -651,18 +720,30 @@ class NaturelaEldomBoiler(EldomBoiler):
             operation_mode
         ]
 
-        self._naturela_boiler_details.State = operation_mode_id
+        async with self._predict(
+            self._naturela_boiler_details, State=operation_mode_id
+        ):
+            await self._send(
+                self._eldom_client.naturela_boiler.set_naturela_boiler_state,
+                self.device_id,
+                operation_mode_id,
+            )
 
-        await self._eldom_client.naturela_boiler.set_naturela_boiler_state(
-            self.device_id, operation_mode_id
-        )
+    def _temperature_prediction(
+        self, temperature: float
+    ) -> tuple[Any, dict[str, Any]]:
+        """Return the details and the fields a new target temperature changes."""
+        return self._naturela_boiler_details, {"ElSetTemp": temperature}
 
     async def set_temperature(self, temperature: float) -> None:
         """Set the temperature of the boiler."""
-        self._naturela_boiler_details.ElSetTemp = temperature
-        await self._eldom_client.naturela_boiler.set_naturela_boiler_temperature(
-            self._id, temperature
-        )
+        details, changes = self._temperature_prediction(temperature)
+        async with self._predict(details, **changes):
+            await self._send(
+                self._eldom_client.naturela_boiler.set_naturela_boiler_temperature,
+                self._id,
+                temperature,
+            )
 
     async def enable_powerful_mode(self) -> None:
         """Enable the boiler's powerful mode."""
@@ -672,27 +753,28 @@ class NaturelaEldomBoiler(EldomBoiler):
             )
             return
 
-        self._naturela_boiler_details.Heater = True
-
-        await self._eldom_client.naturela_boiler.set_naturela_boiler_powerful_mode_on(
-            self.device_id
-        )
+        async with self._predict(self._naturela_boiler_details, Heater=True):
+            await self._send(
+                self._eldom_client.naturela_boiler.set_naturela_boiler_powerful_mode_on,
+                self.device_id,
+            )
 
     async def disable_powerful_mode(self) -> None:
         """Disable the boiler's powerful mode."""
         previous_mode = self.current_operation
         await self.turn_off()
-        await asyncio.sleep(1)
+        await self._wait_until_off()
         await self.set_operation_mode(previous_mode)
 
     async def reset_energy_usage(self) -> None:
         """Reset the energy usage of the boiler."""
-        await self._eldom_client.naturela_boiler.reset_naturela_boiler_energy_usage(
-            self.device_id
+        await self._send(
+            self._eldom_client.naturela_boiler.reset_naturela_boiler_energy_usage,
+            self.device_id,
         )
 
 
-class IoTEldomBoiler(ABC):
+class IoTEldomBoiler(OptimisticDevice, ABC):
     """A base class representation of an IoT Eldom boiler."""
 
     @abstractmethod
@@ -723,6 +805,10 @@ class IoTEldomBoiler(ABC):
     def current_temperature(self) -> float:
         """Retrieve the boiler's current temperature."""
 
+    @abstractmethod
+    def heater_enabled(self) -> bool:
+        """Retrieve whether the boiler's heater is currently active."""
+
     @abstractmethod
     async def turn_on(self) -> None:
         """Turn the boiler on."""
@@ -820,8 +906,11 @@ class FlatIoTEldomBoiler(IoTEldomBoiler):
             operation_mode
         ]
 
-        self._flat_boiler_details.BoilerMode = str(operation_mode_id)
-
-        await self._eldom_client.flat_boiler.set_flat_boiler_state(
-            self._device, operation_mode_id
-        )
+        async with self._predict(
+            self._flat_boiler_details, BoilerMode=str(operation_mode_id)
+        ):
+            await self._send(
+                self._eldom_client.flat_boiler.set_flat_boiler_state,
+                self._device,
+                operation_mode_id,
+            )
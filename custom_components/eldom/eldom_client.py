@@ -1,21 +1,121 @@
 """A wrapper Eldom client uses whichever of the two clients is authenticaed."""
 
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from functools import partial
+import logging
+import math
+import random
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, TypeVar
+
 import aiohttp
-from eldom.client import Client as EldomClient
-from ioteldom.client import Client as IoTEldomClient
+from yarl import URL
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.importlib import async_import_module
 
 from .const import (
-    DEVICE_TYPE_CONVECTOR_HEATER_ELDOM,
-    DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM,
-    DEVICE_TYPE_FLAT_BOILER_ELDOM,
-    DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM,
-    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
-    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEFAULT_DEVICE_CACHE_TTL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RATE_LIMIT,
     ELDOM_API,
+    ELDOM_API_URL,
     IOT_ELDOM_API,
 )
-from .eldom_boiler import FlatEldomBoiler, NaturelaEldomBoiler, SmartEldomBoiler, FlatIoTEldomBoiler
-from .eldom_convector import EldomConvectorHeater, IoTEldomConvectorHeater
+from .device_types import DEVICE_TYPES, classify_device
+from .scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_CONFIRMATION,
+    PRIORITY_INTERACTIVE,
+    RequestScheduler,
+    TokenBucket,
+)
+
+if TYPE_CHECKING:
+    from eldom.client import Client as EldomClient
+    from ioteldom.client import Client as IoTEldomClient
+
+    from .token_provider import SingleFlightTokenProvider
+
+_T = TypeVar("_T")
+
+_LOGGER = logging.getLogger(__name__)
+
+DeviceKey = tuple[int | str, int | str]
+
+# The modules only the client of the given API needs. Just the ones of the
+# configured API are imported.
+API_CLIENT_MODULES = {
+    ELDOM_API: ("eldom.client", "eldom.models"),
+    IOT_ELDOM_API: (
+        "ioteldom.client",
+        "ioteldom.models",
+        f"{__package__}.token_provider",
+    ),
+}
+
+# The longest a single API request may take, even if the update's deadline
+# leaves more time.
+REQUEST_TIMEOUT = timedelta(seconds=10)
+
+# How long a myeldom.com session is used before logging in again ahead of
+# time. The API doesn't tell when a session expires.
+ELDOM_SESSION_MAX_AGE = timedelta(hours=12)
+
+# Reads failing with a transient error are retried with an exponential
+# backoff and full jitter. All attempts share the request's timeout.
+READ_RETRY_ATTEMPTS = 3
+READ_RETRY_BASE_DELAY = timedelta(milliseconds=500)
+READ_RETRY_MAX_DELAY = timedelta(seconds=4)
+
+# Hedging waits for the given percentile of recent status request latencies
+# before sending a duplicate request, and only once enough have been seen.
+HEDGE_LATENCY_PERCENTILE = 0.95
+HEDGE_LATENCY_SAMPLES = 100
+HEDGE_MIN_LATENCY_SAMPLES = 20
+# The share of a poll's status requests that may be hedged.
+HEDGE_BUDGET_RATIO = 0.1
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Return whether a failed request may succeed when it's sent again."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500 or error.status == 429
+
+    return True
+
+
+class InvalidCredentialsError(Exception):
+    """The Eldom API rejected the account's email or password."""
+
+
+async def async_import_api_client(hass: HomeAssistant, api: str) -> None:
+    """Import the client library of an API in the executor.
+
+    Building an `EldomClientWrapper` for the API then doesn't import anything
+    inside the event loop.
+    """
+    for module in API_CLIENT_MODULES[api]:
+        await async_import_module(hass, module)
+
+
+@dataclass
+class DevicesUpdate:
+    """The devices fetched from an Eldom API during one update."""
+
+    device_keys: list[DeviceKey]
+    """The (type, ID) pairs of all supported devices on the account."""
+    devices: dict[int | str, dict]
+    """The fetched devices by type and ID."""
+    failures: dict[DeviceKey, BaseException] = field(default_factory=dict)
+    """The devices whose status couldn't be fetched and why."""
 
 
 class EldomClientWrapper:
@@ -27,132 +127,609 @@ class EldomClientWrapper:
         username: str,
         password: str,
         api: str,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        device_cache_ttl: timedelta = timedelta(minutes=DEFAULT_DEVICE_CACHE_TTL),
+        bulk_status: bool = False,
+        hedged_requests: bool = False,
+        rate_limit: int = DEFAULT_RATE_LIMIT,
     ) -> None:
         """Creates a wrapper Eldom client that operates based on which API is chosen."""
         self.username = username
         self.password = password
         self.api = api
+        self._session = session
+
+        # Called whenever a new session was established, e.g. to store it.
+        self.session_listener: Callable[[], None] | None = None
+
+        # Bounds how many requests are in flight at once and lets commands and
+        # their confirmations go ahead of polling. A bound of 1 falls back to
+        # fetching the devices one after another. A rate limit, in requests per
+        # minute, is shared by polling and commands.
+        self.scheduler = RequestScheduler(
+            max_concurrent_requests,
+            rate_limiter=TokenBucket(rate_limit) if rate_limit > 0 else None,
+        )
+
+        # The device inventory rarely changes, so it's only re-listed once the
+        # TTL expires or a rescan is requested.
+        self._device_cache_ttl = device_cache_ttl.total_seconds()
+        self._device_inventory: list[Any] | None = None
+        self._device_inventory_expires_at = 0.0
+
+        # In bulk mode the myeldom.com device list is fetched on every poll and
+        # each device's `lastDataRefreshDate` decides whether its status needs
+        # to be fetched again or the previously fetched one is still current.
+        self._bulk_status = bulk_status
+        self._eldom_status_cache: dict[int, tuple[str, Any]] = {}
+
+        # The listed device and status each device's wrapper was last built
+        # from, kept to persist a snapshot of the devices.
+        self._device_states: dict[DeviceKey, tuple[Any, Any]] = {}
+
+        # With hedged requests, a status request slower than most recent ones
+        # gets a duplicate and whichever answers first is used.
+        self._hedged_requests = hedged_requests
+        self._status_latencies: deque[float] = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+
+        # Requests rejected because the session expired share a single login,
+        # after which each of them is retried once. If the login fails, the
+        # requests waiting for it fail with the same error.
+        self._login_lock = asyncio.Lock()
+        self._session_generation = 0
+        self._login_error: Exception | None = None
+        self._session_expires_at = 0.0
+
+        # Only the client of the configured API is built, and only its library
+        # is imported.
+        self._api_client: EldomClient | IoTEldomClient
+        self._models: ModuleType
+        self._token_provider: SingleFlightTokenProvider | None = None
+        if api == ELDOM_API:
+            from eldom import models  # noqa: PLC0415
+            from eldom.client import (  # noqa: PLC0415
+                Client as EldomClient,
+                InvalidCredentialsError as EldomInvalidCredentialsError,
+            )
+
+            self._api_client = EldomClient(session)
+            self._models = models
+            self._api_invalid_credentials_error = EldomInvalidCredentialsError
+        elif api == IOT_ELDOM_API:
+            from ioteldom import models  # noqa: PLC0415
+            from ioteldom.client import (  # noqa: PLC0415
+                Client as IoTEldomClient,
+                InvalidCredentialsError as IoTEldomInvalidCredentialsError,
+            )
 
-        self.eldom_client = EldomClient(session)
-        self.iot_eldom_client = IoTEldomClient(session, username, password)
+            from .token_provider import SingleFlightTokenProvider  # noqa: PLC0415
+
+            self._api_client = IoTEldomClient(session, username, password)
+            self._models = models
+            self._api_invalid_credentials_error = IoTEldomInvalidCredentialsError
+
+            # The client and its sub-clients share a token provider that logs in
+            # at most once at a time and renews the token before it expires.
+            self._token_provider = SingleFlightTokenProvider(
+                session, username, password
+            )
+            self._api_client.token_provider = self._token_provider
+            self._api_client.convector_heater.token_provider = self._token_provider
+            self._api_client.flat_boiler.token_provider = self._token_provider
+            self._token_provider.token_listener = self._notify_session_listener
+        else:
+            raise ValueError("Invalid API")
 
     async def login(self):
         """Try to login with the clients."""
         if self.api == ELDOM_API:
-            await self.eldom_client.login(self.username, self.password)
+            async with asyncio.timeout_at(self._request_deadline(None)):
+                await self.scheduler.acquire_token()
+                await self._api_client.login(self.username, self.password)
+            self._session_expires_at = (
+                time.monotonic() + ELDOM_SESSION_MAX_AGE.total_seconds()
+            )
+            self._notify_session_listener()
         elif self.api == IOT_ELDOM_API:
             return
 
-    async def is_connected(self):
-        """Returns true if the corresponding API client is connected."""
+    def export_session(self) -> dict[str, Any]:
+        """Return the authenticated session in a form that can be stored."""
+        session: dict[str, Any] = {"api": self.api, "username": self.username}
+
         if self.api == ELDOM_API:
-            return await self.eldom_client.is_connected()
+            cookies = self._session.cookie_jar.filter_cookies(
+                URL(f"https://{ELDOM_API_URL}")
+            )
+            session["cookies"] = {
+                name: cookie.value for name, cookie in cookies.items()
+            }
+            session["expires_at"] = time.time() + (
+                self._session_expires_at - time.monotonic()
+            )
+        elif self.api == IOT_ELDOM_API:
+            session["token"] = self._token_provider.token
 
-        if self.api == IOT_ELDOM_API:
-            return await self.iot_eldom_client.is_connected()
-
-        raise ValueError("Invalid API")
-
-    async def get_devices(self):
-        """Fetches all devices from the connected API client."""
-        (
-            eldom_flat_boilers,
-            eldom_smart_boilers,
-            eldom_naturela_boilers,
-            eldom_convector_heaters,
-        ) = await self._fetch_eldom_data()
-        (
-            iot_eldom_convector_heaters,
-            iot_eldom_flat_boilers,
-        ) = await self._fetch_iot_eldom_data()
+        return session
 
-        return {
-            DEVICE_TYPE_FLAT_BOILER_ELDOM: eldom_flat_boilers,
-            DEVICE_TYPE_SMART_BOILER_ELDOM: eldom_smart_boilers,
-            DEVICE_TYPE_NATURELA_BOILER_ELDOM: eldom_naturela_boilers,
-            DEVICE_TYPE_CONVECTOR_HEATER_ELDOM: eldom_convector_heaters,
-            DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM: iot_eldom_convector_heaters,
-            DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM: iot_eldom_flat_boilers,
-        }
+    def restore_session(self, session: dict[str, Any]) -> bool:
+        """Reuse a stored session instead of logging in, if it still applies.
 
-    async def _fetch_eldom_data(self):
-        if self.api != ELDOM_API:
-            return {}, {}, {}, {}
+        A restored session that turns out to be rejected is replaced by a fresh
+        login on the first request.
+        """
+        if session.get("api") != self.api or session.get("username") != self.username:
+            return False
 
-        devices = await self.eldom_client.get_devices()
+        if self.api == ELDOM_API:
+            cookies = session.get("cookies")
+            remaining = session.get("expires_at", 0) - time.time()
+            if not cookies or remaining <= 0:
+                return False
 
-        flat_boilers: dict[str, FlatEldomBoiler] = {
-            device.id: FlatEldomBoiler(
-                device.id,
-                await self.eldom_client.flat_boiler.get_flat_boiler_status(device.id),
-                self.eldom_client,
+            self._session.cookie_jar.update_cookies(
+                cookies, response_url=URL(f"https://{ELDOM_API_URL}")
             )
-            for device in devices
-            if device.deviceType == DEVICE_TYPE_FLAT_BOILER_ELDOM
-        }
+            self._session_expires_at = time.monotonic() + remaining
+            return True
+
+        if self.api == IOT_ELDOM_API:
+            if not session.get("token"):
+                return False
+
+            self._token_provider.token = session["token"]
+            return True
+
+        return False
+
+    def _notify_session_listener(self) -> None:
+        """Let the listener know that a new session was established."""
+        if self.session_listener is not None:
+            self.session_listener()
+
+    async def with_reauthentication(self, request: Callable[[], Awaitable[_T]]) -> _T:
+        """Run an API request, logging in again and retrying it once if it was rejected.
+
+        A myeldom.com session that's due for renewal is renewed before the
+        request is sent.
+        """
+        generation = self._session_generation
+        if self.api == ELDOM_API and time.monotonic() >= self._session_expires_at:
+            await self._reauthenticate(generation)
+            generation = self._session_generation
 
-        smart_boilers: dict[str, SmartEldomBoiler] = {
-            device.id: SmartEldomBoiler(
-                device.id,
-                await self.eldom_client.smart_boiler.get_smart_boiler_status(device.id),
-                self.eldom_client,
+        try:
+            await self.scheduler.acquire_token()
+            return await request()
+        except aiohttp.ClientResponseError as e:
+            if e.status not in (401, 403):
+                raise
+
+            _LOGGER.debug(
+                "Eldom API '%s' rejected the session, logging in again", self.api
             )
-            for device in devices
-            if device.deviceType == DEVICE_TYPE_SMART_BOILER_ELDOM
-        }
 
-        naturela_boilers: dict[str, NaturelaEldomBoiler] = {
-            device.id: NaturelaEldomBoiler(
-                device.id,
-                await self.eldom_client.naturela_boiler.get_naturela_boiler_status(
-                    device.id
-                ),
-                self.eldom_client,
+        await self._reauthenticate(generation)
+
+        await self.scheduler.acquire_token()
+        return await request()
+
+    async def _reauthenticate(self, generation: int) -> None:
+        """Log in again, unless another request already did since `generation`.
+
+        Raises the error of that login if it failed.
+        """
+        async with self._login_lock:
+            if self._session_generation != generation:
+                if self._login_error is not None:
+                    raise self._login_error
+                return
+
+            try:
+                await self._login_again()
+            except Exception as err:
+                self._login_error = err
+                self._session_generation += 1
+                raise
+
+            self._login_error = None
+            self._session_generation += 1
+
+    async def _login_again(self) -> None:
+        """Establish a new session, raising InvalidCredentialsError if rejected."""
+        try:
+            if self.api == ELDOM_API:
+                await self.login()
+            elif self.api == IOT_ELDOM_API:
+                self._token_provider.token = None
+                async with asyncio.timeout_at(self._request_deadline(None)):
+                    await self.scheduler.acquire_token()
+                    await self._token_provider.provide()
+        except self._api_invalid_credentials_error as e:
+            raise InvalidCredentialsError("Invalid email or password") from e
+        except aiohttp.ClientResponseError as e:
+            if e.status not in (401, 403):
+                raise
+
+            raise InvalidCredentialsError("Invalid email or password") from e
+
+    async def is_connected(self):
+        """Returns true if the corresponding API client is connected."""
+        try:
+            await self.scheduler.acquire_token()
+            return await self._api_client.is_connected()
+        except self._api_invalid_credentials_error as e:
+            raise InvalidCredentialsError("Invalid email or password") from e
+
+    def invalidate_device_inventory(self) -> None:
+        """Forget the cached device inventory so the next poll lists devices again."""
+        self._device_inventory = None
+
+    async def _get_device_inventory(
+        self, deadline: float | None = None, priority: int = PRIORITY_BACKGROUND
+    ) -> list[Any]:
+        """Return the account's device list, listing it only when the cache is stale."""
+        if (
+            self._device_inventory is not None
+            and time.monotonic() < self._device_inventory_expires_at
+        ):
+            return self._device_inventory
+
+        async with (
+            asyncio.timeout_at(deadline),
+            self.scheduler.slot(priority),
+            asyncio.timeout_at(self._request_deadline(deadline)),
+        ):
+            devices = await self._read_with_retries(self._api_client.get_devices)
+
+        _LOGGER.debug("Listed %d devices from Eldom API '%s'", len(devices), self.api)
+
+        self._device_inventory = devices
+        self._device_inventory_expires_at = time.monotonic() + self._device_cache_ttl
+
+        return devices
+
+    async def get_device_keys(self, deadline: float | None = None) -> list[DeviceKey]:
+        """Return the (type, ID) pairs of all supported devices on the account."""
+        return [
+            (device_type, device_id)
+            for device_type, device_id, _ in self._classify_devices(
+                await self._get_device_inventory(deadline)
             )
-            for device in devices
-            if device.deviceType == DEVICE_TYPE_NATURELA_BOILER_ELDOM
-        }
+        ]
+
+    def _classify_devices(
+        self, inventory: list[Any]
+    ) -> list[tuple[int | str, int | str, Any]]:
+        """Classify the listed devices, skipping the ones that aren't supported."""
+        classified_devices = []
+        for device in inventory:
+            device_type, device_id = classify_device(self.api, device)
+            registered_type = DEVICE_TYPES.get(device_type)
+            if registered_type is None or registered_type.api != self.api:
+                continue
+
+            classified_devices.append((device_type, device_id, device))
+
+        return classified_devices
+
+    async def get_devices(
+        self,
+        device_keys: Collection[DeviceKey] | None = None,
+        deadline: float | None = None,
+        exclude: Collection[DeviceKey] = (),
+    ) -> DevicesUpdate:
+        """Fetches all devices from the connected API client.
 
-        convector_heaters: dict[str, EldomConvectorHeater] = {
-            device.id: EldomConvectorHeater(
-                device.id,
-                await self.eldom_client.convector_heater.get_convector_heater_status(
-                    device.id
-                ),
-                self.eldom_client,
+        When `device_keys` is given, only the devices with those (type, ID)
+        pairs are fetched. Devices in `exclude` are never fetched. A device
+        whose status can't be fetched, including within the event loop time
+        `deadline`, is reported as a failure instead of failing the whole update.
+        """
+        if self._bulk_status and self.api == ELDOM_API:
+            self.invalidate_device_inventory()
+
+        inventory = await self._get_device_inventory(deadline)
+        api_client = self._api_client
+
+        # Classify the devices and look up reusable statuses in a single pass
+        # over the inventory, then fetch all missing statuses in one batch.
+        all_devices = self._classify_devices(inventory)
+        classified_devices = [
+            (device_type, device_id, device, self._get_cached_status(device))
+            for device_type, device_id, device in all_devices
+            if (device_keys is None or (device_type, device_id) in device_keys)
+            and (device_type, device_id) not in exclude
+        ]
+
+        missing_statuses = [
+            partial(
+                self._read_with_retries,
+                partial(DEVICE_TYPES[device_type].get_status, api_client, device),
             )
-            for device in devices
-            if device.deviceType == DEVICE_TYPE_CONVECTOR_HEATER_ELDOM
-        }
+            for device_type, _, device, status in classified_devices
+            if status is None
+        ]
+        hedge_budget = [math.ceil(len(missing_statuses) * HEDGE_BUDGET_RATIO)]
+        statuses = await self._gather_bounded(
+            (
+                self._fetch_status(get_status, hedge_budget)
+                for get_status in missing_statuses
+            ),
+            deadline=deadline,
+            return_exceptions=True,
+        )
 
-        return flat_boilers, smart_boilers, naturela_boilers, convector_heaters
+        # Rejected credentials aren't a problem of a single device, so they fail
+        # the whole update.
+        for status in statuses:
+            if isinstance(status, InvalidCredentialsError):
+                raise status
 
-    async def _fetch_iot_eldom_data(self):
-        if self.api != IOT_ELDOM_API:
-            return {}, {}
+        fetched_statuses = iter(statuses)
 
-        devices = await self.iot_eldom_client.get_devices()
+        update = DevicesUpdate(
+            device_keys=[
+                (device_type, device_id) for device_type, device_id, _ in all_devices
+            ],
+            devices={device_type: {} for device_type in DEVICE_TYPES},
+        )
+        for device_type, device_id, device, status in classified_devices:
+            if status is None:
+                status = next(fetched_statuses)
+                if isinstance(status, BaseException):
+                    _LOGGER.warning(
+                        "Failed to fetch the status of Eldom device '%s': %s",
+                        device_id,
+                        status,
+                    )
+                    update.failures[(device_type, device_id)] = status
+                    continue
 
-        convector_heaters: dict[str, IoTEldomConvectorHeater] = {
-            device.uuid: IoTEldomConvectorHeater(
-                device,
-                await self.iot_eldom_client.convector_heater.get_convector_heater_status(
-                    device
-                ),
-                self.iot_eldom_client,
+                self._cache_status(device, status)
+
+            update.devices[device_type][device_id] = self._create_device(
+                (device_type, device_id), device, status, api_client
             )
-            for device in devices
-            if device.model == DEVICE_TYPE_CONVECTOR_HEATER_IOT_ELDOM
-        }
 
-        flat_boilers: dict[str, FlatIoTEldomBoiler] = {
-            device.uuid: FlatIoTEldomBoiler(
-                device,
-                await self.iot_eldom_client.flat_boiler.get_flat_boiler_status(device),
-                self.iot_eldom_client,
+        return update
+
+    async def get_device(self, device_key: DeviceKey) -> Any | None:
+        """Fetch the current status of a single device.
+
+        The device is looked up in the cached inventory and its status is always
+        fetched, even in bulk mode. Returns None if the device isn't listed.
+        """
+        inventory = await self._get_device_inventory(priority=PRIORITY_CONFIRMATION)
+        api_client = self._api_client
+
+        for device_type, device_id, device in self._classify_devices(inventory):
+            if (device_type, device_id) != device_key:
+                continue
+
+            (status,) = await self._gather_bounded(
+                [
+                    self._read_with_retries(
+                        partial(
+                            DEVICE_TYPES[device_type].get_status, api_client, device
+                        )
+                    )
+                ],
+                priority=PRIORITY_CONFIRMATION,
             )
-            for device in devices
-            if device.model == DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM
+            self._cache_status(device, status)
+
+            return self._create_device(device_key, device, status, api_client)
+
+        return None
+
+    def _create_device(
+        self,
+        device_key: DeviceKey,
+        device: Any,
+        status: Any,
+        api_client: EldomClient | IoTEldomClient,
+    ) -> Any:
+        """Build a device's wrapper and remember what it was built from.
+
+        The wrapper sends each of its API requests through the wrapper client,
+        so a rejected session is renewed for that request alone, and reads its
+        own status back through `get_device`.
+        """
+        self._device_states[device_key] = (device, status)
+
+        wrapper = DEVICE_TYPES[device_key[0]].create(device, status, api_client)
+        wrapper.request_sender = self._send_command_request
+        wrapper.device_fetcher = partial(self.get_device, device_key)
+        return wrapper
+
+    async def _send_command_request(self, request: Callable[[], Awaitable[_T]]) -> _T:
+        """Send a single request of a device command, ahead of polling.
+
+        The request slot is only held while the request is in flight, not for
+        the whole command, and never for longer than the request timeout.
+        """
+        async with self.scheduler.slot(PRIORITY_INTERACTIVE):
+            async with asyncio.timeout_at(self._request_deadline(None)):
+                return await self.with_reauthentication(request)
+
+    def export_device(self, device_key: DeviceKey) -> dict[str, Any] | None:
+        """Return what the device's wrapper was last built from, ready to store."""
+        state = self._device_states.get(device_key)
+        if state is None:
+            return None
+
+        device, status = state
+        device_type, device_id = device_key
+        return {
+            "type": device_type,
+            "id": device_id,
+            "device": asdict(device),
+            "status": asdict(status),
         }
 
-        return convector_heaters, flat_boilers
+    def restore_device(self, stored_device: dict[str, Any]) -> tuple[DeviceKey, Any]:
+        """Rebuild a device's wrapper from what `export_device` returned.
+
+        Raises KeyError, AttributeError or TypeError if the device type is no
+        longer supported or the stored models don't match the current ones.
+        """
+        device_key = (stored_device["type"], stored_device["id"])
+        status_model = getattr(self._models, DEVICE_TYPES[device_key[0]].status_model)
+
+        device = self._models.Device(**stored_device["device"])
+        status = status_model(**stored_device["status"])
+        self._cache_status(device, status)
+
+        return device_key, self._create_device(
+            device_key, device, status, self._api_client
+        )
+
+    def _get_cached_status(self, device: Any) -> Any | None:
+        """Return the last fetched status of a device if it's still current.
+
+        Only myeldom.com devices in bulk mode can be served from the cache, as
+        their `lastDataRefreshDate` tells whether the device reported new data.
+        """
+        if not self._bulk_status or self.api != ELDOM_API:
+            return None
+
+        cached_status = self._eldom_status_cache.get(device.id)
+        if cached_status is None or cached_status[0] != device.lastDataRefreshDate:
+            return None
+
+        return cached_status[1]
+
+    def _cache_status(self, device: Any, status: Any) -> None:
+        """Remember a freshly fetched status for bulk mode."""
+        if self._bulk_status and self.api == ELDOM_API:
+            self._eldom_status_cache[device.id] = (device.lastDataRefreshDate, status)
+
+    async def _read_with_retries(self, read: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a read, retrying it on transient errors with a jittered backoff.
+
+        Connection errors, timeouts, server errors and rate limiting responses
+        are retried. Other errors, such as rejected requests, are raised right
+        away.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self.with_reauthentication(read)
+            except (aiohttp.ClientError, TimeoutError) as e:
+                attempt += 1
+                if attempt == READ_RETRY_ATTEMPTS or not _is_transient_error(e):
+                    raise
+
+                delay = random.uniform(
+                    0,
+                    min(
+                        READ_RETRY_BASE_DELAY.total_seconds() * 2 ** (attempt - 1),
+                        READ_RETRY_MAX_DELAY.total_seconds(),
+                    ),
+                )
+                _LOGGER.debug(
+                    "Retrying Eldom API read in %.2f seconds after error: %s", delay, e
+                )
+                await asyncio.sleep(delay)
+
+    def _hedge_delay(self) -> float | None:
+        """Return how long to wait before hedging a status request, if at all."""
+        if (
+            not self._hedged_requests
+            or len(self._status_latencies) < HEDGE_MIN_LATENCY_SAMPLES
+        ):
+            return None
+
+        latencies = sorted(self._status_latencies)
+        return latencies[
+            min(len(latencies) - 1, int(len(latencies) * HEDGE_LATENCY_PERCENTILE))
+        ]
+
+    async def _fetch_status(
+        self, get_status: Callable[[], Awaitable[_T]], hedge_budget: list[int]
+    ) -> _T:
+        """Fetch a device's status, hedging it with a duplicate request if it's slow.
+
+        A duplicate is only sent while the poll's `hedge_budget` lasts, and it
+        waits for a request slot of its own like any other request. The first
+        successful response wins and the other request is cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        hedge_delay = self._hedge_delay()
+
+        if hedge_delay is None:
+            status = await get_status()
+            self._status_latencies.append(loop.time() - started_at)
+            return status
+
+        requests = {asyncio.ensure_future(get_status())}
+        try:
+            done, pending = await asyncio.wait(requests, timeout=hedge_delay)
+            if not done and hedge_budget[0] > 0:
+                hedge_budget[0] -= 1
+                _LOGGER.debug(
+                    "Hedging a status request slower than %.2f seconds", hedge_delay
+                )
+                requests.add(asyncio.ensure_future(self._send_hedge(get_status)))
+
+            while True:
+                done, pending = await asyncio.wait(
+                    requests, return_when=asyncio.FIRST_COMPLETED
+                )
+                for request in done:
+                    if request.exception() is None:
+                        self._status_latencies.append(loop.time() - started_at)
+                        return request.result()
+
+                if not pending:
+                    # Every request failed, so report the last error.
+                    raise next(iter(done)).exception()
+
+                requests = pending
+        finally:
+            for request in requests:
+                request.cancel()
+
+    async def _send_hedge(self, get_status: Callable[[], Awaitable[_T]]) -> _T:
+        """Send the duplicate of a slow status request once it gets a slot."""
+        async with self.scheduler.slot(PRIORITY_BACKGROUND):
+            return await get_status()
+
+    def _request_deadline(self, deadline: float | None) -> float:
+        """Return when a request starting now must finish, given the update's deadline."""
+        request_deadline = (
+            asyncio.get_running_loop().time() + REQUEST_TIMEOUT.total_seconds()
+        )
+        if deadline is None:
+            return request_deadline
+
+        return min(deadline, request_deadline)
+
+    async def _gather_bounded(
+        self,
+        requests: Iterable[Awaitable[_T]],
+        deadline: float | None = None,
+        return_exceptions: bool = False,
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> list[_T]:
+        """Run the requests concurrently while respecting the concurrency bound.
+
+        Waiting for a slot counts against the deadline. Each request gets
+        whatever is left until the deadline once it gets its turn, capped at the
+        per-request timeout.
+        """
+
+        async def _run(request: Awaitable[_T]) -> _T:
+            async with (
+                asyncio.timeout_at(deadline),
+                self.scheduler.slot(priority),
+                asyncio.timeout_at(self._request_deadline(deadline)),
+            ):
+                return await request
+
+        return await asyncio.gather(
+            *(_run(request) for request in requests),
+            return_exceptions=return_exceptions,
+        )
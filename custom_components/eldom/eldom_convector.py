@@ -1,17 +1,23 @@
 """Eldom convector heater objects."""
 
-import logging
+from __future__ import annotations
 
-from eldom.client import Client as EldomClient
-from eldom.models import ConvectorHeaterDetails as EldomConvectorHeaterDetails
-from ioteldom.client import Client as IoTEldomClient
-from ioteldom.models import (
-    ConvectorHeaterDetails as IoTEldomConvectorHeaterDetails,
-    Device as IoTEldomConvectorHeaterDevice,
-)
+import logging
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.climate import HVACMode
 
+from .optimistic import OptimisticSetpointDevice
+
+if TYPE_CHECKING:
+    from eldom.client import Client as EldomClient
+    from eldom.models import ConvectorHeaterDetails as EldomConvectorHeaterDetails
+    from ioteldom.client import Client as IoTEldomClient
+    from ioteldom.models import (
+        ConvectorHeaterDetails as IoTEldomConvectorHeaterDetails,
+        Device as IoTEldomConvectorHeaterDevice,
+    )
+
 ELDOM_OPERATION_MODES = {0: HVACMode.OFF, 1: HVACMode.HEAT}
 IOT_ELDOM_OPERATION_MODES = {"0": HVACMode.OFF, "16": HVACMode.HEAT}
 
@@ -21,7 +27,7 @@ MIN_TEMP = 5
 _LOGGER = logging.getLogger(__name__)
 
 
-class EldomConvectorHeater:
+class EldomConvectorHeater(OptimisticSetpointDevice):
     """An Eldom convector heater representation object."""
 
     def __init__(
@@ -112,6 +118,14 @@ class EldomConvectorHeater:
             self._convector_heater_details.State, "Unknown"
         )
 
+    @property
+    def heater_enabled(self) -> bool:
+        """Retrieve whether the heater is on and still below its target temperature."""
+        return (
+            self.current_operation == HVACMode.HEAT
+            and self.current_temperature < self.target_temperature
+        )
+
     @property
     def power_level(self) -> int:
         """Retrieve the heating level of the heater."""
@@ -134,22 +148,33 @@ class EldomConvectorHeater:
             operation_mode
         ]
 
-        self._convector_heater_details.State = operation_mode_id
-
-        await self._eldom_client.convector_heater.set_convector_heater_state(
-            self.device_id, operation_mode_id
-        )
+        async with self._predict(
+            self._convector_heater_details, State=operation_mode_id
+        ):
+            await self._send(
+                self._eldom_client.convector_heater.set_convector_heater_state,
+                self.device_id,
+                operation_mode_id,
+            )
+
+    def _temperature_prediction(
+        self, temperature: float
+    ) -> tuple[Any, dict[str, Any]]:
+        """Return the details and the fields a new target temperature changes."""
+        return self._convector_heater_details, {"SetTemp": temperature}
 
     async def set_temperature(self, temperature: float) -> None:
         """Set the temperature of the heater."""
-        self._convector_heater_details.SetTemp = temperature
-
-        await self._eldom_client.convector_heater.set_convector_heater_temperature(
-            self.device_id, temperature
-        )
+        details, changes = self._temperature_prediction(temperature)
+        async with self._predict(details, **changes):
+            await self._send(
+                self._eldom_client.convector_heater.set_convector_heater_temperature,
+                self.device_id,
+                temperature,
+            )
 
 
-class IoTEldomConvectorHeater:
+class IoTEldomConvectorHeater(OptimisticSetpointDevice):
     """An IoT Eldom convector heater representation object."""
 
     def __init__(
@@ -215,6 +240,14 @@ class IoTEldomConvectorHeater:
             self._convector_heater_details.Operation, "Unknown"
         )
 
+    @property
+    def heater_enabled(self) -> bool:
+        """Retrieve whether the heater is on and still below its target temperature."""
+        return (
+            self.current_operation == HVACMode.HEAT
+            and self.current_temperature < self.target_temperature
+        )
+
     async def turn_on(self) -> None:
         """Turn the heater on."""
         await self.set_operation_mode(HVACMode.HEAT)
@@ -232,16 +265,27 @@ class IoTEldomConvectorHeater:
             operation_mode
         ]
 
-        self._convector_heater_details.Operation = operation_mode_id
-
-        await self._iot_eldom_client.convector_heater.set_convector_heater_state(
-            self._convector_heater_device, int(operation_mode_id)
-        )
+        async with self._predict(
+            self._convector_heater_details, Operation=operation_mode_id
+        ):
+            await self._send(
+                self._iot_eldom_client.convector_heater.set_convector_heater_state,
+                self._convector_heater_device,
+                int(operation_mode_id),
+            )
+
+    def _temperature_prediction(
+        self, temperature: float
+    ) -> tuple[Any, dict[str, Any]]:
+        """Return the details and the fields a new target temperature changes."""
+        return self._convector_heater_details, {"TSet": str(int(temperature) * 10)}
 
     async def set_temperature(self, temperature: float) -> None:
         """Set the temperature of the heater."""
-        self._convector_heater_details.TSet = str(int(temperature) * 10)
-
-        await self._iot_eldom_client.convector_heater.set_convector_heater_temperature(
-            self._convector_heater_device, int(temperature)
-        )
+        details, changes = self._temperature_prediction(temperature)
+        async with self._predict(details, **changes):
+            await self._send(
+                self._iot_eldom_client.convector_heater.set_convector_heater_temperature,
+                self._convector_heater_device,
+                int(temperature),
+            )
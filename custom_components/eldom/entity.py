@@ -0,0 +1,42 @@
+"""Base entities for the Eldom integration."""
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import EldomCoordinator
+
+
+class EldomEntity(CoordinatorEntity[EldomCoordinator]):
+    """An entity of an Eldom device, following the device's latest wrapper."""
+
+    def __init__(self, coordinator: EldomCoordinator, device: Any) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+
+        self._device = device
+
+    @property
+    def available(self) -> bool:
+        """Return whether the device's state is known and recent enough."""
+        return super().available and self.coordinator.device_available(self._device)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._device = self.coordinator.current_device(self._device)
+
+        self.async_write_ha_state()
+
+
+class EldomDeviceEntity(EldomEntity):
+    """The main entity of an Eldom device, e.g. its water heater or climate entity.
+
+    Tells when the device's state was last refreshed and whether it's stale.
+    """
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return when the device's state was last refreshed and whether it's stale."""
+        return self.coordinator.device_freshness(self._device.type, self._device.id)
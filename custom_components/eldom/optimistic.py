@@ -0,0 +1,100 @@
+"""Optimistic state for Eldom device commands."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+class OptimisticDevice:
+    """A device wrapper that shows the predicted outcome of a command right away.
+
+    The predicted details are written before the command is sent and rolled
+    back if it fails. Until the command completes, the coordinator keeps this
+    wrapper instead of replacing it with a newly fetched snapshot.
+    """
+
+    state_listener: Callable[[], None] | None = None
+    """Called whenever the details change because of a prediction, set by the coordinator."""
+
+    request_sender: Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]] | None = (
+        None
+    )
+    """Sends a single API request, e.g. logging in again if the session expired."""
+
+    device_fetcher: Callable[[], Awaitable[Any]] | None = None
+    """Fetches the device's current state as a new wrapper, or None if it's gone."""
+
+    _commands_in_flight = 0
+
+    @property
+    def has_commands_in_flight(self) -> bool:
+        """Return whether a command sent to the device hasn't completed yet."""
+        return self._commands_in_flight > 0
+
+    async def _send(self, request: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+        """Send a single API request through the request sender, if one is set.
+
+        Each request of a command is sent on its own, so a retried request
+        doesn't repeat the ones sent before it.
+        """
+        if self.request_sender is None:
+            return await request(*args)
+
+        return await self.request_sender(partial(request, *args))
+
+    @asynccontextmanager
+    async def _predict(self, details: Any, **changes: Any) -> AsyncIterator[None]:
+        """Apply the predicted changes to the details while the command is sent.
+
+        If the command raises, the changed fields are restored to their
+        previous values and the error is propagated.
+        """
+        previous = {name: getattr(details, name) for name in changes}
+
+        self._commands_in_flight += 1
+        self._set_details(details, changes)
+        try:
+            yield
+        except Exception:
+            self._set_details(details, previous)
+            raise
+        finally:
+            self._commands_in_flight -= 1
+
+    def _set_details(self, details: Any, values: dict[str, Any]) -> None:
+        """Set the given fields of the details and notify the listener."""
+        for name, value in values.items():
+            setattr(details, name, value)
+
+        if self.state_listener is not None:
+            self.state_listener()
+
+
+class OptimisticSetpointDevice(OptimisticDevice, ABC):
+    """An optimistic device wrapper whose target temperature can be set.
+
+    A new target temperature can be shown before it's sent, e.g. while a burst
+    of changes is coalesced.
+    """
+
+    @abstractmethod
+    def _temperature_prediction(
+        self, temperature: float
+    ) -> tuple[Any, dict[str, Any]]:
+        """Return the details and the fields a new target temperature changes."""
+
+    def preview_temperature(self, temperature: float) -> Callable[[], None]:
+        """Show a new target temperature right away, before it's sent.
+
+        Returns a callable that restores the previous target temperature.
+        """
+        details, changes = self._temperature_prediction(temperature)
+        previous = {name: getattr(details, name) for name in changes}
+
+        self._set_details(details, changes)
+
+        return partial(self._set_details, details, previous)
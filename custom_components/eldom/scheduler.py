@@ -0,0 +1,200 @@
+"""Priority scheduling of the requests sent to an Eldom account."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import heapq
+import itertools
+import time
+
+# Request priorities, lower goes first.
+PRIORITY_INTERACTIVE = 0
+"""Commands sent on behalf of a user."""
+PRIORITY_CONFIRMATION = 1
+"""Reads confirming the outcome of a command."""
+PRIORITY_BACKGROUND = 2
+"""Reads done by regular polling."""
+
+# How many seconds worth of requests the rate limiter lets through at once.
+RATE_LIMIT_BURST_SECONDS = 15
+
+# The priority of the slot held by the current task. Its HTTP requests wait for
+# rate limiter tokens with that priority, and requests sent without a slot,
+# like logins, with the highest one.
+_slot_priority: ContextVar[int] = ContextVar(
+    "eldom_slot_priority", default=PRIORITY_INTERACTIVE
+)
+
+
+class TokenBucket:
+    """Limits the rate of requests, allowing short bursts."""
+
+    def __init__(self, requests_per_minute: int) -> None:
+        """Initialize the bucket, starting full."""
+        self.rate = requests_per_minute / 60
+        self.capacity = max(1.0, self.rate * RATE_LIMIT_BURST_SECONDS)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def fill_level(self) -> float:
+        """Return how many requests can be sent right away."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def wait_time(self) -> float:
+        """Return how many seconds a request sent now would wait for a token."""
+        return max(0.0, (1 - self.fill_level) / self.rate)
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available right away."""
+        if self.fill_level < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+    def give_back(self) -> None:
+        """Return a token that was taken but not used."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+
+class RequestScheduler:
+    """Hands out a bounded number of request slots, highest priority first.
+
+    Waiting requests are granted slots in priority order, then in arrival
+    order. Background requests can't take the last slot, so a command never
+    waits for a whole batch of status requests to finish. With a rate limiter,
+    every HTTP request sent, retries included, also waits for a token, see
+    `acquire_token`. Tokens are handed out in the same order as slots.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.rate_limiter = rate_limiter
+        self._capacity = max(1, max_concurrent_requests)
+        self._background_capacity = max(1, self._capacity - 1)
+        self._in_use = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._token_waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._token_timer: asyncio.TimerHandle | None = None
+        self._sequence = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        """Return how many requests are waiting for a slot."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the context."""
+        await self._acquire(priority)
+        priority_token = _slot_priority.set(priority)
+        try:
+            yield
+        finally:
+            _slot_priority.reset(priority_token)
+            self._release()
+
+    async def acquire_token(self) -> None:
+        """Wait until the rate limiter lets another HTTP request through.
+
+        Called right before each request is sent, so the wait counts against
+        the request's timeout. Waiting requests get tokens in the priority order
+        of the slots they hold, then in arrival order.
+        """
+        if self.rate_limiter is None:
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._token_waiters, (_slot_priority.get(), next(self._sequence), future)
+        )
+        self._grant_tokens()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A token granted right before the cancellation is given back.
+            if future.done() and not future.cancelled():
+                self.rate_limiter.give_back()
+                self._grant_tokens()
+            raise
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait until the request is granted a slot."""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._grant()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A slot granted right before the cancellation is passed on.
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Free a slot and grant it to the next waiting request."""
+        self._in_use -= 1
+        self._grant()
+
+    def _grant(self) -> None:
+        """Grant free slots to the waiting requests in priority order."""
+        while self._waiters and self._in_use < self._capacity:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                # The request was cancelled while waiting.
+                heapq.heappop(self._waiters)
+                continue
+
+            if (
+                priority == PRIORITY_BACKGROUND
+                and self._in_use >= self._background_capacity
+            ):
+                return
+
+            heapq.heappop(self._waiters)
+            self._in_use += 1
+            future.set_result(None)
+
+    def _grant_tokens(self) -> None:
+        """Grant the available tokens to the waiting requests in priority order.
+
+        Once the tokens run out, granting resumes when the next one is earned.
+        """
+        if self._token_timer is not None:
+            self._token_timer.cancel()
+            self._token_timer = None
+
+        while self._token_waiters:
+            _, _, future = self._token_waiters[0]
+            if future.done():
+                # The request was cancelled while waiting.
+                heapq.heappop(self._token_waiters)
+                continue
+
+            if not self.rate_limiter.try_acquire():
+                self._token_timer = asyncio.get_running_loop().call_later(
+                    self.rate_limiter.wait_time, self._grant_tokens
+                )
+                return
+
+            heapq.heappop(self._token_waiters)
+            future.set_result(None)
@@ -6,11 +6,10 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfEnergy, UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform, UnitOfEnergy, UnitOfTemperature
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DEVICE_TYPE_FLAT_BOILER_ELDOM,
@@ -20,7 +19,9 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import EldomCoordinator
+from .device_types import build_entities, register_entity
 from .eldom_boiler import EldomBoiler, FlatIoTEldomBoiler
+from .entity import EldomEntity
 from .models import EldomData
 
 HEATER_STATE_ON = "On"
@@ -36,141 +37,40 @@ async def async_setup_entry(
 
     eldom_data: EldomData = hass.data[DOMAIN][config_entry.entry_id]
 
-    await eldom_data.coordinator.async_config_entry_first_refresh()
+    async_add_entities(build_entities(Platform.SENSOR, eldom_data.coordinator))
 
-    entities_to_add = []
 
-    for flat_boiler in eldom_data.coordinator.data.get(
-        DEVICE_TYPE_FLAT_BOILER_ELDOM
-    ).values():
-        entities_to_add.append(
-            EldomBoilerDayEnergyConsumptionSensor(flat_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerNightEnergyConsumptionSensor(flat_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerSavedEnergySensor(flat_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerHeaterSensor(flat_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerEnergyUsageResetDateSensor(flat_boiler, eldom_data.coordinator)
-        )
-
-    for smart_boiler in eldom_data.coordinator.data.get(
-        DEVICE_TYPE_SMART_BOILER_ELDOM
-    ).values():
-        entities_to_add.append(
-            EldomBoilerDayEnergyConsumptionSensor(smart_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerNightEnergyConsumptionSensor(
-                smart_boiler, eldom_data.coordinator
-            )
-        )
-        entities_to_add.append(
-            EldomBoilerSavedEnergySensor(smart_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerHeaterSensor(smart_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerEnergyUsageResetDateSensor(smart_boiler, eldom_data.coordinator)
-        )
-
-    for naturela_boiler in eldom_data.coordinator.data.get(
-        DEVICE_TYPE_NATURELA_BOILER_ELDOM
-    ).values():
-        entities_to_add.append(
-            EldomBoilerDayEnergyConsumptionSensor(
-                naturela_boiler, eldom_data.coordinator
-            )
-        )
-        entities_to_add.append(
-            EldomBoilerNightEnergyConsumptionSensor(
-                naturela_boiler, eldom_data.coordinator
-            )
-        )
-        entities_to_add.append(
-            EldomBoilerHeaterSensor(naturela_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomBoilerEnergyUsageResetDateSensor(
-                naturela_boiler, eldom_data.coordinator
-            )
-        )
-        entities_to_add.append(
-            EldomNaturelaSolarTemperatureSensor(naturela_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomNaturelaBoilerTemperatureSensor(
-                naturela_boiler, eldom_data.coordinator
-            )
-        )
-        entities_to_add.append(
-            EldomNaturelaTopTemperatureSensor(naturela_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            EldomNaturelaMiddleTemperatureSensor(
-                naturela_boiler, eldom_data.coordinator
-            )
-        )
-        entities_to_add.append(
-            EldomNaturelaBottomTemperatureSensor(
-                naturela_boiler, eldom_data.coordinator
-            )
-        )
-        entities_to_add.append(
-            EldomNaturelaHeaterOnTemperatureSensor(
-                naturela_boiler, eldom_data.coordinator
-            )
-        )
-
-    for iot_flat_boiler in eldom_data.coordinator.data.get(
-        DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM
-    ).values():
-        entities_to_add.append(
-            IoTFlatBoilerHeaterSensor(iot_flat_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            IoTFlatBoilerChamber1TempSensor(iot_flat_boiler, eldom_data.coordinator)
-        )
-        entities_to_add.append(
-            IoTFlatBoilerChamber2TempSensor(iot_flat_boiler, eldom_data.coordinator)
-        )
-
-    async_add_entities(entities_to_add)
-
-
-class EldomBoilerDayEnergyConsumptionSensor(SensorEntity, CoordinatorEntity):
+@register_entity(
+    Platform.SENSOR,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+)
+class EldomBoilerDayEnergyConsumptionSensor(SensorEntity, EldomEntity):
     """Representation of an Eldom boiler day energy consumption sensor."""
 
     def __init__(
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom energy consumption sensor."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-day-energy-consumption-sensor"
+        return f"{self._device.device_id}-day-energy-consumption-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Day Energy Consumption"
+        return f"{self._device.name}'s Day Energy Consumption"
 
     @property
     def icon(self) -> str:
@@ -195,45 +95,40 @@ class EldomBoilerDayEnergyConsumptionSensor(SensorEntity, CoordinatorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return int(self._eldom_boiler.day_energy_consumption)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
-        )
-
-        self.async_write_ha_state()
+        return int(self._device.day_energy_consumption)
 
 
-class EldomBoilerNightEnergyConsumptionSensor(SensorEntity, CoordinatorEntity):
+@register_entity(
+    Platform.SENSOR,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+)
+class EldomBoilerNightEnergyConsumptionSensor(SensorEntity, EldomEntity):
     """Representation of an Eldom boiler night energy consumption sensor."""
 
     def __init__(
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom energy consumption sensor."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-night-energy-consumption-sensor"
+        return f"{self._device.device_id}-night-energy-consumption-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Night Energy Consumption"
+        return f"{self._device.name}'s Night Energy Consumption"
 
     @property
     def icon(self) -> str:
@@ -258,45 +153,37 @@ class EldomBoilerNightEnergyConsumptionSensor(SensorEntity, CoordinatorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return int(self._eldom_boiler.night_energy_consumption)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
-        )
-
-        self.async_write_ha_state()
+        return int(self._device.night_energy_consumption)
 
 
-class EldomBoilerSavedEnergySensor(SensorEntity, CoordinatorEntity):
+@register_entity(
+    Platform.SENSOR, DEVICE_TYPE_FLAT_BOILER_ELDOM, DEVICE_TYPE_SMART_BOILER_ELDOM
+)
+class EldomBoilerSavedEnergySensor(SensorEntity, EldomEntity):
     """Representation of an Eldom boiler energy saved sensor."""
 
     def __init__(
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom energy saved sensor."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-energy-saved-sensor"
+        return f"{self._device.device_id}-energy-saved-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Saved Energy"
+        return f"{self._device.name}'s Saved Energy"
 
     @property
     def icon(self) -> str:
@@ -316,45 +203,40 @@ class EldomBoilerSavedEnergySensor(SensorEntity, CoordinatorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return int(self._eldom_boiler.saved_energy / 100)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
-        )
-
-        self.async_write_ha_state()
+        return int(self._device.saved_energy / 100)
 
 
-class EldomBoilerHeaterSensor(SensorEntity, CoordinatorEntity):
+@register_entity(
+    Platform.SENSOR,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+)
+class EldomBoilerHeaterSensor(SensorEntity, EldomEntity):
     """Representation of an Eldom boiler's heater."""
 
     def __init__(
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize a sensor for an Eldom boiler's heater."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-heater-sensor"
+        return f"{self._device.device_id}-heater-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Heater"
+        return f"{self._device.name}'s Heater"
 
     @property
     def icon(self) -> str:
@@ -375,46 +257,41 @@ class EldomBoilerHeaterSensor(SensorEntity, CoordinatorEntity):
     def native_value(self) -> int:
         """Return the state of the sensor."""
         return (
-            HEATER_STATE_ON if self._eldom_boiler.heater_enabled else HEATER_STATE_OFF
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
+            HEATER_STATE_ON if self._device.heater_enabled else HEATER_STATE_OFF
         )
 
-        self.async_write_ha_state()
 
-
-class EldomBoilerEnergyUsageResetDateSensor(SensorEntity, CoordinatorEntity):
+@register_entity(
+    Platform.SENSOR,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+)
+class EldomBoilerEnergyUsageResetDateSensor(SensorEntity, EldomEntity):
     """Representation of an Eldom boiler's energy usage reset date."""
 
     def __init__(
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize a sensor for an Eldom boiler's heater."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-energy-usage-reset-date-sensor"
+        return f"{self._device.device_id}-energy-usage-reset-date-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Energy Usage Reset Date"
+        return f"{self._device.name}'s Energy Usage Reset Date"
 
     @property
     def icon(self) -> str:
@@ -424,22 +301,13 @@ class EldomBoilerEnergyUsageResetDateSensor(SensorEntity, CoordinatorEntity):
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        if self._eldom_boiler.energy_usage_reset_date == "0001-01-01T00:00:00Z":
+        if self._device.energy_usage_reset_date == "0001-01-01T00:00:00Z":
             return "Never"
 
-        return self._eldom_boiler.energy_usage_reset_date
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
-        )
-
-        self.async_write_ha_state()
+        return self._device.energy_usage_reset_date
 
 
-class EldomNaturelaTemperatureSensor(SensorEntity, CoordinatorEntity):
+class EldomNaturelaTemperatureSensor(SensorEntity, EldomEntity):
     """Base class for Naturela boiler temperature sensors."""
 
     def __init__(
@@ -447,13 +315,13 @@ class EldomNaturelaTemperatureSensor(SensorEntity, CoordinatorEntity):
     ) -> None:
         """Initialize a Naturela temperature sensor."""
         super().__init__(coordinator)
-        self._eldom_boiler = eldom_boiler
+        self._device = eldom_boiler
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this sensor."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
@@ -471,27 +339,20 @@ class EldomNaturelaTemperatureSensor(SensorEntity, CoordinatorEntity):
         """Return the unit of measurement."""
         return UnitOfTemperature.CELSIUS
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
-        )
-        self.async_write_ha_state()
-
 
+@register_entity(Platform.SENSOR, DEVICE_TYPE_NATURELA_BOILER_ELDOM)
 class EldomNaturelaSolarTemperatureSensor(EldomNaturelaTemperatureSensor):
     """Sensor for the Naturela boiler's solar collector temperature."""
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-solar-temperature-sensor"
+        return f"{self._device.device_id}-solar-temperature-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Solar Temperature"
+        return f"{self._device.name}'s Solar Temperature"
 
     @property
     def icon(self) -> str:
@@ -501,21 +362,22 @@ class EldomNaturelaSolarTemperatureSensor(EldomNaturelaTemperatureSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self._eldom_boiler.solar_temperature
+        return self._device.solar_temperature
 
 
+@register_entity(Platform.SENSOR, DEVICE_TYPE_NATURELA_BOILER_ELDOM)
 class EldomNaturelaBoilerTemperatureSensor(EldomNaturelaTemperatureSensor):
     """Sensor for the Naturela boiler's intake temperature."""
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-boiler-temperature-sensor"
+        return f"{self._device.device_id}-boiler-temperature-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Boiler Temperature"
+        return f"{self._device.name}'s Boiler Temperature"
 
     @property
     def icon(self) -> str:
@@ -525,21 +387,22 @@ class EldomNaturelaBoilerTemperatureSensor(EldomNaturelaTemperatureSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self._eldom_boiler.boiler_temperature
+        return self._device.boiler_temperature
 
 
+@register_entity(Platform.SENSOR, DEVICE_TYPE_NATURELA_BOILER_ELDOM)
 class EldomNaturelaTopTemperatureSensor(EldomNaturelaTemperatureSensor):
     """Sensor for the Naturela boiler's top tank zone temperature."""
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-top-temperature-sensor"
+        return f"{self._device.device_id}-top-temperature-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Tank Top Temperature"
+        return f"{self._device.name}'s Tank Top Temperature"
 
     @property
     def icon(self) -> str:
@@ -549,21 +412,22 @@ class EldomNaturelaTopTemperatureSensor(EldomNaturelaTemperatureSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self._eldom_boiler.top_temperature
+        return self._device.top_temperature
 
 
+@register_entity(Platform.SENSOR, DEVICE_TYPE_NATURELA_BOILER_ELDOM)
 class EldomNaturelaMiddleTemperatureSensor(EldomNaturelaTemperatureSensor):
     """Sensor for the Naturela boiler's middle tank zone temperature."""
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-middle-temperature-sensor"
+        return f"{self._device.device_id}-middle-temperature-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Tank Middle Temperature"
+        return f"{self._device.name}'s Tank Middle Temperature"
 
     @property
     def icon(self) -> str:
@@ -573,21 +437,22 @@ class EldomNaturelaMiddleTemperatureSensor(EldomNaturelaTemperatureSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self._eldom_boiler.middle_temperature
+        return self._device.middle_temperature
 
 
+@register_entity(Platform.SENSOR, DEVICE_TYPE_NATURELA_BOILER_ELDOM)
 class EldomNaturelaBottomTemperatureSensor(EldomNaturelaTemperatureSensor):
     """Sensor for the Naturela boiler's bottom tank zone temperature."""
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-bottom-temperature-sensor"
+        return f"{self._device.device_id}-bottom-temperature-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Tank Bottom Temperature"
+        return f"{self._device.name}'s Tank Bottom Temperature"
 
     @property
     def icon(self) -> str:
@@ -597,21 +462,22 @@ class EldomNaturelaBottomTemperatureSensor(EldomNaturelaTemperatureSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self._eldom_boiler.bottom_temperature
+        return self._device.bottom_temperature
 
 
+@register_entity(Platform.SENSOR, DEVICE_TYPE_NATURELA_BOILER_ELDOM)
 class EldomNaturelaHeaterOnTemperatureSensor(EldomNaturelaTemperatureSensor):
     """Sensor for the Naturela boiler's electric heater activation temperature."""
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-heater-on-temperature-sensor"
+        return f"{self._device.device_id}-heater-on-temperature-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._eldom_boiler.name}'s Heater Activation Temperature"
+        return f"{self._device.name}'s Heater Activation Temperature"
 
     @property
     def icon(self) -> str:
@@ -621,36 +487,35 @@ class EldomNaturelaHeaterOnTemperatureSensor(EldomNaturelaTemperatureSensor):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self._eldom_boiler.heater_on_temperature
+        return self._device.heater_on_temperature
 
 
-class IoTFlatBoilerHeaterSensor(SensorEntity, CoordinatorEntity):
+@register_entity(Platform.SENSOR, DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM)
+class IoTFlatBoilerHeaterSensor(SensorEntity, EldomEntity):
     """Representation of an IoT Eldom flat boiler's heater."""
 
     def __init__(
         self, boiler: FlatIoTEldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an IoT flat boiler heater sensor."""
-        super().__init__(coordinator)
-
-        self._boiler = boiler
+        super().__init__(coordinator, boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._boiler.device_id}-heater-sensor"
+        return f"{self._device.device_id}-heater-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._boiler.name}'s Heater"
+        return f"{self._device.name}'s Heater"
 
     @property
     def icon(self) -> str:
@@ -670,45 +535,35 @@ class IoTFlatBoilerHeaterSensor(SensorEntity, CoordinatorEntity):
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        return HEATER_STATE_ON if self._boiler.heater_enabled else HEATER_STATE_OFF
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._boiler = self.coordinator.data.get(self._boiler.type).get(
-            self._boiler.id
-        )
+        return HEATER_STATE_ON if self._device.heater_enabled else HEATER_STATE_OFF
 
-        self.async_write_ha_state()
 
-
-class IoTFlatBoilerChamber1TempSensor(SensorEntity, CoordinatorEntity):
+@register_entity(Platform.SENSOR, DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM)
+class IoTFlatBoilerChamber1TempSensor(SensorEntity, EldomEntity):
     """Representation of an IoT Eldom flat boiler's chamber 1 temperature."""
 
     def __init__(
         self, boiler: FlatIoTEldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an IoT flat boiler chamber 1 temperature sensor."""
-        super().__init__(coordinator)
-
-        self._boiler = boiler
+        super().__init__(coordinator, boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._boiler.device_id}-chamber1-temp-sensor"
+        return f"{self._device.device_id}-chamber1-temp-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._boiler.name}'s Chamber 1 Temperature"
+        return f"{self._device.name}'s Chamber 1 Temperature"
 
     @property
     def icon(self) -> str:
@@ -733,45 +588,35 @@ class IoTFlatBoilerChamber1TempSensor(SensorEntity, CoordinatorEntity):
     @property
     def native_value(self) -> float:
         """Return the state of the sensor."""
-        return self._boiler.chamber1_temperature
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._boiler = self.coordinator.data.get(self._boiler.type).get(
-            self._boiler.id
-        )
-
-        self.async_write_ha_state()
+        return self._device.chamber1_temperature
 
 
-class IoTFlatBoilerChamber2TempSensor(SensorEntity, CoordinatorEntity):
+@register_entity(Platform.SENSOR, DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM)
+class IoTFlatBoilerChamber2TempSensor(SensorEntity, EldomEntity):
     """Representation of an IoT Eldom flat boiler's chamber 2 temperature."""
 
     def __init__(
         self, boiler: FlatIoTEldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an IoT flat boiler chamber 2 temperature sensor."""
-        super().__init__(coordinator)
-
-        self._boiler = boiler
+        super().__init__(coordinator, boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._boiler.device_id}-chamber2-temp-sensor"
+        return f"{self._device.device_id}-chamber2-temp-sensor"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return f"{self._boiler.name}'s Chamber 2 Temperature"
+        return f"{self._device.name}'s Chamber 2 Temperature"
 
     @property
     def icon(self) -> str:
@@ -796,13 +641,4 @@ class IoTFlatBoilerChamber2TempSensor(SensorEntity, CoordinatorEntity):
     @property
     def native_value(self) -> float:
         """Return the state of the sensor."""
-        return self._boiler.chamber2_temperature
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._boiler = self.coordinator.data.get(self._boiler.type).get(
-            self._boiler.id
-        )
-
-        self.async_write_ha_state()
+        return self._device.chamber2_temperature
@@ -0,0 +1,166 @@
+"""Services for the Eldom integration."""
+
+import asyncio
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_TEMPERATURE
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .commands import COMMAND_OPERATION_MODE, COMMAND_TEMPERATURE
+from .const import (
+    ATTR_DEVICES,
+    ATTR_OPERATION_MODE,
+    DOMAIN,
+    SERVICE_APPLY,
+    SERVICE_RESCAN_DEVICES,
+)
+from .coordinator import EldomCoordinator
+from .eldom_client import DeviceKey
+from .models import EldomData
+
+# How many devices `eldom.apply` commands at the same time.
+APPLY_MAX_CONCURRENT_DEVICES = 4
+
+APPLY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICES): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_DEVICE_ID): cv.string,
+                        vol.Optional(ATTR_OPERATION_MODE): cv.string,
+                        vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+                    }
+                )
+            ],
+        )
+    }
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Eldom services."""
+
+    async def _async_rescan_devices(call: ServiceCall) -> None:
+        """Re-list the devices of every loaded Eldom account."""
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            eldom_data: EldomData | None = hass.data.get(DOMAIN, {}).get(
+                entry.entry_id
+            )
+            if eldom_data is None:
+                continue
+
+            if await eldom_data.coordinator.async_rescan_devices():
+                _LOGGER.info(
+                    "Eldom devices changed for '%s', reloading to update entities",
+                    entry.title,
+                )
+                hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    async def _async_apply(call: ServiceCall) -> ServiceResponse:
+        """Command several devices concurrently and refresh them once afterwards."""
+        semaphore = asyncio.Semaphore(APPLY_MAX_CONCURRENT_DEVICES)
+        commanded_devices: dict[EldomCoordinator, set[DeviceKey]] = {}
+
+        async def _async_apply_device(request: dict[str, Any]) -> dict[str, Any]:
+            device_id = request[ATTR_DEVICE_ID]
+
+            found = _find_device(hass, device_id)
+            if found is None:
+                return {"success": False, "error": "Device not found"}
+
+            coordinator, eldom_device = found
+            commanded_devices.setdefault(coordinator, set()).add(
+                (eldom_device.type, eldom_device.id)
+            )
+
+            try:
+                async with semaphore:
+                    if ATTR_OPERATION_MODE in request:
+                        operation_mode = request[ATTR_OPERATION_MODE]
+                        await coordinator.async_run_command(
+                            eldom_device,
+                            COMMAND_OPERATION_MODE,
+                            lambda device: device.set_operation_mode(operation_mode),
+                        )
+                    if ATTR_TEMPERATURE in request:
+                        temperature = request[ATTR_TEMPERATURE]
+                        await coordinator.async_run_command(
+                            eldom_device,
+                            COMMAND_TEMPERATURE,
+                            lambda device: device.set_temperature(temperature),
+                        )
+            except Exception as e:  # noqa: BLE001
+                _LOGGER.error("Error while applying to device '%s': %s", device_id, e)
+                return {"success": False, "error": str(e)}
+
+            return {"success": True}
+
+        requests = call.data[ATTR_DEVICES]
+        results = await asyncio.gather(
+            *(_async_apply_device(request) for request in requests)
+        )
+
+        # Only the commanded devices are refreshed, all of an account's at once.
+        await asyncio.gather(
+            *(
+                coordinator.async_refresh_devices(device_keys)
+                for coordinator, device_keys in commanded_devices.items()
+            )
+        )
+
+        # A device listed more than once gets a result for every time it's listed.
+        return {
+            "results": [
+                {ATTR_DEVICE_ID: request[ATTR_DEVICE_ID], **result}
+                for request, result in zip(requests, results, strict=True)
+            ]
+        }
+
+    hass.services.async_register(DOMAIN, SERVICE_RESCAN_DEVICES, _async_rescan_devices)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY,
+        _async_apply,
+        schema=APPLY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _find_device(
+    hass: HomeAssistant, device_id: str
+) -> tuple[EldomCoordinator, Any] | None:
+    """Return the coordinator and wrapper of the device with the given registry ID."""
+    device_entry = dr.async_get(hass).async_get(device_id)
+    if device_entry is None:
+        return None
+
+    identifiers = {
+        identifier
+        for domain, identifier in device_entry.identifiers
+        if domain == DOMAIN
+    }
+
+    eldom_data: EldomData
+    for eldom_data in hass.data.get(DOMAIN, {}).values():
+        coordinator = eldom_data.coordinator
+        for devices in (coordinator.data or {}).values():
+            for device in devices.values():
+                if str(device.device_id) in identifiers:
+                    return coordinator, device
+
+    return None
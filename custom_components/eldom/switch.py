@@ -1,14 +1,17 @@
 """Switch platform for Eldom integration."""
 
+import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .commands import COMMAND_POWERFUL_MODE
 from .const import (
     DEVICE_TYPE_FLAT_BOILER_ELDOM,
     DEVICE_TYPE_NATURELA_BOILER_ELDOM,
@@ -16,11 +19,15 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import EldomCoordinator
+from .device_types import build_entities, register_entity
 from .eldom_boiler import EldomBoiler
+from .entity import EldomEntity
 from .models import EldomData
 
 SWITCH_NAME = "Powerful"
 
+_LOGGER = logging.getLogger(__name__)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,57 +38,40 @@ async def async_setup_entry(
 
     eldom_data: EldomData = hass.data[DOMAIN][config_entry.entry_id]
 
-    await eldom_data.coordinator.async_config_entry_first_refresh()
-
-    async_add_entities(
-        EldomBoilerPowerfulModeSwitch(flat_boiler, eldom_data.coordinator)
-        for flat_boiler in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_FLAT_BOILER_ELDOM, []
-        ).values()
-    )
-
-    async_add_entities(
-        EldomBoilerPowerfulModeSwitch(smart_boiler, eldom_data.coordinator)
-        for smart_boiler in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_SMART_BOILER_ELDOM, []
-        ).values()
-    )
+    async_add_entities(build_entities(Platform.SWITCH, eldom_data.coordinator))
 
-    async_add_entities(
-        EldomBoilerPowerfulModeSwitch(naturela_boiler, eldom_data.coordinator)
-        for naturela_boiler in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_NATURELA_BOILER_ELDOM, []
-        ).values()
-    )
 
-
-class EldomBoilerPowerfulModeSwitch(SwitchEntity, CoordinatorEntity):
+@register_entity(
+    Platform.SWITCH,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+)
+class EldomBoilerPowerfulModeSwitch(SwitchEntity, EldomEntity):
     """Representation of Eldom powerful switch."""
 
     def __init__(
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom powerful control."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            identifiers={(DOMAIN, self._device.device_id)},
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"{self._eldom_boiler.device_id}-powerful-switch"
+        return f"{self._device.device_id}-powerful-switch"
 
     @property
     def name(self) -> str:
         """Return the name of the powerful mode switch."""
-        return f"{self._eldom_boiler.name}'s {SWITCH_NAME} Switch"
+        return f"{self._device.name}'s {SWITCH_NAME} Switch"
 
     @property
     def icon(self) -> str:
@@ -96,23 +86,36 @@ class EldomBoilerPowerfulModeSwitch(SwitchEntity, CoordinatorEntity):
     @property
     def is_on(self) -> bool:
         """Return the powerful status."""
-        return self._eldom_boiler.powerful_enabled
+        return self._device.powerful_enabled
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn powerful mode on."""
-        await self._eldom_boiler.enable_powerful_mode()
-        self.schedule_update_ha_state()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_POWERFUL_MODE,
+                lambda device: device.enable_powerful_mode(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while enabling powerful mode: %s", e)
+            raise HomeAssistantError("Error while enabling powerful mode") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn powerful mode off by cycling off then restoring the previous mode."""
-        await self._eldom_boiler.disable_powerful_mode()
-        await self.coordinator.async_request_refresh()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_POWERFUL_MODE,
+                lambda device: device.disable_powerful_mode(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while disabling powerful mode: %s", e)
+            raise HomeAssistantError("Error while disabling powerful mode") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
         )
-
-        self.async_write_ha_state()
@@ -0,0 +1,58 @@
+"""Token handling for the IoT Eldom API."""
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import time
+
+import aiohttp
+from ioteldom.token_provider import TokenProvider
+import jwt
+
+# How long before its expiry an IoT Eldom token is already replaced.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+
+def _token_expires_soon(token: str) -> bool:
+    """Return whether the JWT is expired or about to expire."""
+    try:
+        payload = jwt.decode(jwt=token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return True
+
+    expires_at = payload.get("exp")
+    if not expires_at:
+        return True
+
+    return time.time() >= expires_at - TOKEN_REFRESH_MARGIN.total_seconds()
+
+
+class SingleFlightTokenProvider(TokenProvider):
+    """An IoT Eldom token provider that logs in once for all concurrent requests.
+
+    The token is replaced shortly before it expires, so requests don't run
+    into an expired token in the first place.
+    """
+
+    def __init__(
+        self, session: aiohttp.ClientSession, username: str, password: str
+    ) -> None:
+        """Initialize the token provider."""
+        super().__init__(session, username, password)
+        self._lock = asyncio.Lock()
+        self.token_listener: Callable[[], None] | None = None
+
+    async def provide(self) -> str:
+        """Return a valid token, logging in first if needed."""
+        if self.token is not None and not _token_expires_soon(self.token):
+            return self.token
+
+        async with self._lock:
+            if self.token is None or _token_expires_soon(self.token):
+                self.token = None
+                await super().provide()
+
+                if self.token_listener is not None:
+                    self.token_listener()
+
+        return self.token
@@ -8,13 +8,13 @@ from homeassistant.components.water_heater import (
     WaterHeaterEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform, UnitOfTemperature
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .commands import COMMAND_OPERATION_MODE
 from .const import (
     DEVICE_TYPE_FLAT_BOILER_ELDOM,
     DEVICE_TYPE_MAPPING,
@@ -25,7 +25,9 @@ from .const import (
     MANUFACTURER_NAME,
 )
 from .coordinator import EldomCoordinator
+from .device_types import build_entities, register_entity
 from .eldom_boiler import EldomBoiler, IoTEldomBoiler
+from .entity import EldomDeviceEntity
 from .models import EldomData
 
 SUPPORT_FLAGS_ELDOM_HEATER = (
@@ -54,38 +56,18 @@ async def async_setup_entry(
 
     eldom_data: EldomData = hass.data[DOMAIN][entry.entry_id]
 
-    await eldom_data.coordinator.async_config_entry_first_refresh()
-
-    async_add_entities(
-        EldomWaterHeaterEntity(flat_boiler, eldom_data.coordinator)
-        for flat_boiler in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_FLAT_BOILER_ELDOM
-        ).values()
-    )
-
-    async_add_entities(
-        EldomWaterHeaterEntity(smart_boiler, eldom_data.coordinator)
-        for smart_boiler in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_SMART_BOILER_ELDOM
-        ).values()
-    )
-
-    async_add_entities(
-        EldomWaterHeaterEntity(naturela_boiler, eldom_data.coordinator)
-        for naturela_boiler in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_NATURELA_BOILER_ELDOM
-        ).values()
-    )
-
     async_add_entities(
-        IoTEldomWaterHeaterEntity(flat_boiler, eldom_data.coordinator)
-        for flat_boiler in eldom_data.coordinator.data.get(
-            DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM
-        ).values()
+        build_entities(Platform.WATER_HEATER, eldom_data.coordinator)
     )
 
 
-class EldomWaterHeaterEntity(WaterHeaterEntity, CoordinatorEntity):
+@register_entity(
+    Platform.WATER_HEATER,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DEVICE_TYPE_SMART_BOILER_ELDOM,
+    DEVICE_TYPE_NATURELA_BOILER_ELDOM,
+)
+class EldomWaterHeaterEntity(WaterHeaterEntity, EldomDeviceEntity):
     """Representation of an Eldom flat water heater.
 
     The CoordinatorEntity class provides:
@@ -99,31 +81,29 @@ class EldomWaterHeaterEntity(WaterHeaterEntity, CoordinatorEntity):
         self, eldom_boiler: EldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom water heater."""
-        super().__init__(coordinator)
-
-        self._eldom_boiler = eldom_boiler
+        super().__init__(coordinator, eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            name=self._eldom_boiler.name,
-            identifiers={(DOMAIN, self._eldom_boiler.device_id)},
+            name=self._device.name,
+            identifiers={(DOMAIN, self._device.device_id)},
             manufacturer=MANUFACTURER_NAME,
-            model=DEVICE_TYPE_MAPPING.get(self._eldom_boiler.type),
-            sw_version=str(self._eldom_boiler.software_version),
-            hw_version=str(self._eldom_boiler.hardware_version),
+            model=DEVICE_TYPE_MAPPING.get(self._device.type),
+            sw_version=str(self._device.software_version),
+            hw_version=str(self._device.hardware_version),
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return self._eldom_boiler.device_id
+        return self._device.device_id
 
     @property
     def name(self) -> str:
         """Return the name of the water heater."""
-        return self._eldom_boiler.name
+        return self._device.name
 
     @property
     def supported_features(self) -> WaterHeaterEntityFeature:
@@ -138,51 +118,76 @@ class EldomWaterHeaterEntity(WaterHeaterEntity, CoordinatorEntity):
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature."""
-        return self._eldom_boiler.max_temperature
+        return self._device.max_temperature
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature."""
-        return self._eldom_boiler.min_temperature
+        return self._device.min_temperature
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._eldom_boiler.current_temperature
+        return self._device.current_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
-        return self._eldom_boiler.target_temperature
+        return self._device.target_temperature
 
     @property
     def current_operation(self) -> str | None:
         """Return current operation ie. Heating, Smart, or Study."""
-        return self._eldom_boiler.current_operation
+        return self._device.current_operation
 
     @property
     def operation_list(self) -> list[str] | None:
         """Return the list of available operation modes."""
-        return self._eldom_boiler.operation_modes
+        return self._device.operation_modes
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the water heater on."""
-        await self._eldom_boiler.turn_on()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_on(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning on: %s", e)
+            raise HomeAssistantError("Error while turning on") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the water heater off."""
-        await self._eldom_boiler.turn_off()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_off(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning off: %s", e)
+            raise HomeAssistantError("Error while turning off") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new target operation mode."""
         try:
-            await self._eldom_boiler.set_operation_mode(operation_mode)
-            self.schedule_update_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.set_operation_mode(operation_mode),
+            )
+            await self.coordinator.async_refresh_device(
+                self._device.type, self._device.id
+            )
         except Exception as e:
             _LOGGER.error("Error while setting operation mode: %s", e)
             raise HomeAssistantError("Error while setting operation mode") from e
@@ -190,21 +195,22 @@ class EldomWaterHeaterEntity(WaterHeaterEntity, CoordinatorEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get("temperature")
-        await self._eldom_boiler.set_temperature(temperature)
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._eldom_boiler = self.coordinator.data.get(self._eldom_boiler.type).get(
-            self._eldom_boiler.id
-        )
+        try:
+            sent = await self.coordinator.async_set_temperature(
+                self._device, temperature
+            )
+        except Exception as e:
+            _LOGGER.error("Error while setting temperature: %s", e)
+            raise HomeAssistantError("Error while setting temperature") from e
 
-        self.async_write_ha_state()
+        if sent:
+            await self.coordinator.async_refresh_device(
+                self._device.type, self._device.id
+            )
 
 
-class IoTEldomWaterHeaterEntity(WaterHeaterEntity, CoordinatorEntity):
+@register_entity(Platform.WATER_HEATER, DEVICE_TYPE_FLAT_BOILER_IOT_ELDOM)
+class IoTEldomWaterHeaterEntity(WaterHeaterEntity, EldomDeviceEntity):
     """Representation of an IoT Eldom flat water heater.
 
     The CoordinatorEntity class provides:
@@ -218,29 +224,27 @@ class IoTEldomWaterHeaterEntity(WaterHeaterEntity, CoordinatorEntity):
         self, iot_eldom_boiler: IoTEldomBoiler, coordinator: EldomCoordinator
     ) -> None:
         """Initialize an Eldom water heater."""
-        super().__init__(coordinator)
-
-        self._iot_eldom_boiler = iot_eldom_boiler
+        super().__init__(coordinator, iot_eldom_boiler)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this water heater."""
         return DeviceInfo(
-            name=self._iot_eldom_boiler.name,
-            identifiers={(DOMAIN, self._iot_eldom_boiler.device_id)},
+            name=self._device.name,
+            identifiers={(DOMAIN, self._device.device_id)},
             manufacturer=MANUFACTURER_NAME,
-            model=DEVICE_TYPE_MAPPING.get(self._iot_eldom_boiler.type),
+            model=DEVICE_TYPE_MAPPING.get(self._device.type),
         )
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return self._iot_eldom_boiler.device_id
+        return self._device.device_id
 
     @property
     def name(self) -> str:
         """Return the name of the water heater."""
-        return self._iot_eldom_boiler.name
+        return self._device.name
 
     @property
     def supported_features(self) -> WaterHeaterEntityFeature:
@@ -255,45 +259,61 @@ class IoTEldomWaterHeaterEntity(WaterHeaterEntity, CoordinatorEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._iot_eldom_boiler.current_temperature
+        return self._device.current_temperature
 
     @property
     def current_operation(self) -> str | None:
         """Return current operation ie. Heating, Smart, or Study."""
-        return self._iot_eldom_boiler.current_operation
+        return self._device.current_operation
 
     @property
     def operation_list(self) -> list[str] | None:
         """Return the list of available operation modes."""
-        return self._iot_eldom_boiler.operation_modes
+        return self._device.operation_modes
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the water heater on."""
-        await self._iot_eldom_boiler.turn_on()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_on(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning on: %s", e)
+            raise HomeAssistantError("Error while turning on") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the water heater off."""
-        await self._iot_eldom_boiler.turn_off()
-        self.schedule_update_ha_state()
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.turn_off(),
+            )
+        except Exception as e:
+            _LOGGER.error("Error while turning off: %s", e)
+            raise HomeAssistantError("Error while turning off") from e
+
+        await self.coordinator.async_refresh_device(
+            self._device.type, self._device.id
+        )
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new target operation mode."""
         try:
-            await self._iot_eldom_boiler.set_operation_mode(operation_mode)
-            self.schedule_update_ha_state()
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_run_command(
+                self._device,
+                COMMAND_OPERATION_MODE,
+                lambda device: device.set_operation_mode(operation_mode),
+            )
+            await self.coordinator.async_refresh_device(
+                self._device.type, self._device.id
+            )
         except Exception as e:
             _LOGGER.error("Error while setting operation mode: %s", e)
             raise HomeAssistantError("Error while setting operation mode") from e
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._iot_eldom_boiler = self.coordinator.data.get(
-            self._iot_eldom_boiler.type
-        ).get(self._iot_eldom_boiler.id)
-
-        self.async_write_ha_state()
@@ -0,0 +1,195 @@
+"""Measure how long setting up the Eldom integration takes.
+
+Times a config entry's setup until the entities of all its devices are written
+to the state machine. The setup runs against a simulated myeldom.com account
+with 1, 50 and 500 flat boilers, where every request takes a fixed latency.
+
+Requires Home Assistant and pytest-homeassistant-custom-component:
+
+    python scripts/benchmark_startup.py [--latency 0.05] [--runs 3]
+"""
+
+import argparse
+import asyncio
+from dataclasses import fields
+from pathlib import Path
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+from eldom.models import Device, FlatBoilerDetails
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from homeassistant import loader
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.eldom.const import (  # noqa: E402
+    CONF_API,
+    DEVICE_TYPE_FLAT_BOILER_ELDOM,
+    DOMAIN,
+    ELDOM_API,
+)
+
+DEVICE_COUNTS = (1, 50, 500)
+
+# Placeholder values of the model fields the simulated devices don't set.
+_FIELD_DEFAULTS = {int: 0, float: 0.0, str: "", bool: False}
+
+
+def _simulated_device(device_id: int) -> Device:
+    """Return a listed flat boiler."""
+    device = Device(
+        **{
+            model_field.name: _FIELD_DEFAULTS.get(model_field.type)
+            for model_field in fields(Device)
+        }
+    )
+    device.id = device_id
+    device.realDeviceId = f"BENCH{device_id:06d}"
+    device.deviceType = DEVICE_TYPE_FLAT_BOILER_ELDOM
+    device.name = f"Boiler {device_id}"
+    device.lastDataRefreshDate = "2024-01-01T00:00:00"
+    return device
+
+
+def _simulated_status(device_id: int) -> FlatBoilerDetails:
+    """Return the status of a flat boiler heating up in eco mode."""
+    status = FlatBoilerDetails(
+        **{
+            model_field.name: _FIELD_DEFAULTS.get(model_field.type)
+            for model_field in fields(FlatBoilerDetails)
+        }
+    )
+    status.ID = device_id
+    status.DeviceID = f"BENCH{device_id:06d}"
+    status.EnergyDate = "0001-01-01T00:00:00Z"
+    status.SetTemp = 55
+    status.STL_Temp = 42
+    status.State = 3
+    return status
+
+
+async def _async_measure(device_count: int, latency: float) -> tuple[float, int]:
+    """Set up an entry with the given number of devices.
+
+    Returns how many seconds passed until the last entity state was written and
+    how many entities were written.
+    """
+    devices = [_simulated_device(device_id) for device_id in range(device_count)]
+
+    async def _respond(result=None):
+        await asyncio.sleep(latency)
+        return result
+
+    async def _login(self, email, password):
+        await _respond()
+
+    async def _is_connected(self):
+        return await _respond(True)
+
+    async def _get_devices(self):
+        return await _respond(list(devices))
+
+    async def _get_flat_boiler_status(self, device_id):
+        return await _respond(_simulated_status(device_id))
+
+    async with async_test_home_assistant() as hass:
+        hass: HomeAssistant
+        # Let the loader find the integration in this repository.
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_USERNAME: "benchmark@example.com",
+                CONF_PASSWORD: "benchmark",
+                CONF_API: ELDOM_API,
+            },
+        )
+        entry.add_to_hass(hass)
+
+        last_written_at = 0.0
+
+        @callback
+        def _async_state_written(event: Event) -> None:
+            nonlocal last_written_at
+            last_written_at = time.perf_counter()
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_written)
+
+        with (
+            patch("eldom.client.Client.login", _login),
+            patch("eldom.client.Client.is_connected", _is_connected),
+            patch("eldom.client.Client.get_devices", _get_devices),
+            patch(
+                "eldom.flat_boiler.FlatBoilerClient.get_flat_boiler_status",
+                _get_flat_boiler_status,
+            ),
+        ):
+            started_at = time.perf_counter()
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+
+            entity_entries = er.async_entries_for_config_entry(
+                er.async_get(hass), entry.entry_id
+            )
+            written = sum(
+                hass.states.get(entity_entry.entity_id) is not None
+                for entity_entry in entity_entries
+            )
+            assert written == len(entity_entries), "Not all entities were written"
+
+            await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+
+        return last_written_at - started_at, written
+
+
+async def _async_main(latency: float, runs: int) -> None:
+    """Run the benchmark for every device count and print the results."""
+    print(f"Simulated request latency: {latency * 1000:.0f} ms, {runs} runs each")
+    print(f"{'devices':>8} {'entities':>9} {'median':>9} {'min':>9} {'max':>9}")
+
+    for device_count in DEVICE_COUNTS:
+        durations = []
+        for _ in range(runs):
+            duration, entities = await _async_measure(device_count, latency)
+            durations.append(duration)
+
+        print(
+            f"{device_count:>8} {entities:>9} "
+            f"{statistics.median(durations):>8.3f}s "
+            f"{min(durations):>8.3f}s {max(durations):>8.3f}s"
+        )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="seconds every simulated request takes (default: 0.05)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="how many times each device count is measured (default: 3)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(_async_main(args.latency, args.runs))
+
+
+if __name__ == "__main__":
+    main()
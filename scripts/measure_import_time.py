@@ -0,0 +1,145 @@
+"""Measure how long importing the Eldom integration takes.
+
+Imports the integration's modules, the way Home Assistant loads them at boot,
+in a fresh interpreter with `-X importtime`. The Home Assistant modules the
+integration builds on are imported first, as they're loaded at boot anyway,
+so only the integration's own share is reported. The client library of each
+API, which is only imported when an entry for that API is set up, is reported
+separately.
+
+Requires Home Assistant and pyeldom:
+
+    python scripts/measure_import_time.py [--runs 5]
+"""
+
+import argparse
+from collections import defaultdict
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
+
+# Loaded by Home Assistant at boot, whether or not the integration is set up.
+BASELINE_MODULES = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.button",
+    "homeassistant.components.climate",
+    "homeassistant.components.sensor",
+    "homeassistant.components.switch",
+    "homeassistant.components.water_heater",
+)
+
+INTEGRATION_MODULES = (
+    "custom_components.eldom",
+    "custom_components.eldom.config_flow",
+    "custom_components.eldom.button",
+    "custom_components.eldom.climate",
+    "custom_components.eldom.sensor",
+    "custom_components.eldom.switch",
+    "custom_components.eldom.water_heater",
+)
+
+API_CLIENT_MODULES = {
+    "myeldom": ("eldom.client", "eldom.models"),
+    "ioteldom": (
+        "ioteldom.client",
+        "ioteldom.models",
+        "custom_components.eldom.token_provider",
+    ),
+}
+
+_MARKER = "-- eldom import time --"
+
+
+def _measure(modules: tuple[str, ...], preloaded: tuple[str, ...]) -> dict[str, int]:
+    """Import the modules after the preloaded ones and return the time per package.
+
+    The times are the microseconds spent importing each top-level package, or
+    each integration, not counting the preloaded modules.
+    """
+    code = "\n".join(
+        [
+            "import importlib, sys",
+            *(f"importlib.import_module({module!r})" for module in preloaded),
+            f"print({_MARKER!r}, file=sys.stderr, flush=True)",
+            *(f"importlib.import_module({module!r})" for module in modules),
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPOSITORY_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    _, _, measured = result.stderr.partition(_MARKER)
+
+    times: dict[str, int] = defaultdict(int)
+    for line in measured.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_time, _, name = (part.strip() for part in line[12:].split("|"))
+        if not self_time.isdigit():
+            continue
+
+        top_level = name.split(".")[0]
+        package = (
+            ".".join(name.split(".")[:2])
+            if top_level == "custom_components"
+            else top_level
+        )
+        times[package] += int(self_time)
+
+    return times
+
+
+def _report(
+    title: str, modules: tuple[str, ...], preloaded: tuple[str, ...], runs: int
+) -> None:
+    """Print the median import time of the modules, by package."""
+    measurements = [_measure(modules, preloaded) for _ in range(runs)]
+    packages = sorted({package for times in measurements for package in times})
+    medians = {
+        package: statistics.median(times.get(package, 0) for times in measurements)
+        for package in packages
+    }
+
+    print(f"{title}: {sum(medians.values()) / 1000:.1f} ms")
+    for package, median in sorted(medians.items(), key=lambda item: -item[1]):
+        print(f"  {package:<40} {median / 1000:>8.1f} ms")
+
+
+def main() -> None:
+    """Parse the arguments and report the import times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="how many times each import is measured (default: 5)",
+    )
+    args = parser.parse_args()
+
+    _report("Integration", INTEGRATION_MODULES, BASELINE_MODULES, args.runs)
+    for api, modules in API_CLIENT_MODULES.items():
+        _report(
+            f"Client library for '{api}'",
+            modules,
+            BASELINE_MODULES + INTEGRATION_MODULES,
+            args.runs,
+        )
+
+
+if __name__ == "__main__":
+    main()